@@ -0,0 +1,41 @@
+"""Add alert daily rollup materialized view
+
+Revision ID: 0d0409f09d43
+Revises: 59f60232cf1c
+Create Date: 2026-10-15 21:24:57.231805
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0d0409f09d43'
+down_revision = '59f60232cf1c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE MATERIALIZED VIEW alert_daily_rollup AS
+        SELECT date_trunc('day', timestamp) AS day,
+               auv_id,
+               severity,
+               alert_type,
+               count(*) AS alert_count
+        FROM alerts
+        GROUP BY 1, 2, 3, 4
+    """)
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ix_alert_daily_rollup_key',
+        'alert_daily_rollup',
+        ['day', 'auv_id', 'severity', 'alert_type'],
+        unique=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_alert_daily_rollup_key', table_name='alert_daily_rollup')
+    op.execute("DROP MATERIALIZED VIEW alert_daily_rollup")
@@ -0,0 +1,42 @@
+"""Add composite alert indexes
+
+Revision ID: 73ba605bc12b
+Revises: 0d0409f09d43
+Create Date: 2026-10-15 21:27:08.392176
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '73ba605bc12b'
+down_revision = '0d0409f09d43'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Covers AUV-scoped listings filtered by status and ordered newest first
+        op.create_index(
+            'ix_alerts_auv_status_ts',
+            'alerts',
+            ['auv_id', 'status', sa.text('timestamp DESC')],
+            postgresql_include=['severity', 'alert_type', 'title'],
+            postgresql_concurrently=True
+        )
+        # Matches the (timestamp, id) keyset used for cursor pagination
+        op.create_index(
+            'ix_alerts_timestamp_id',
+            'alerts',
+            [sa.text('timestamp DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_alerts_timestamp_id', table_name='alerts', postgresql_concurrently=True)
+        op.drop_index('ix_alerts_auv_status_ts', table_name='alerts', postgresql_concurrently=True)
@@ -0,0 +1,40 @@
+"""Add telemetry (auv_id, timestamp) indexes
+
+Revision ID: a41c7e9d2b58
+Revises: 73ba605bc12b
+Create Date: 2026-10-15 21:40:12.518834
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41c7e9d2b58'
+down_revision = '73ba605bc12b'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Per-AUV time ranges feed date_bin aggregation and ORDER BY timestamp DESC LIMIT 1 lookups
+        op.create_index(
+            'ix_auv_data_auv_ts',
+            'auv_data',
+            ['auv_id', sa.text('timestamp DESC')],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_telemetry_data_auv_ts',
+            'telemetry_data',
+            ['auv_id', sa.text('timestamp DESC')],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_telemetry_data_auv_ts', table_name='telemetry_data', postgresql_concurrently=True)
+        op.drop_index('ix_auv_data_auv_ts', table_name='auv_data', postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""Autosummarize telemetry BRIN indexes
+
+Revision ID: a9c4f1d27b63
+Revises: e6c1b8f35a72
+Create Date: 2026-10-16 00:12:55.671094
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a9c4f1d27b63'
+down_revision = 'e6c1b8f35a72'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partitioned indexes reject ALTER INDEX ... SET, so the BRIN indexes are rebuilt with the option;
+    # partitions created later clone it from the parent
+    for table in ('auv_data', 'telemetry_data'):
+        op.drop_index(f'ix_{table}_timestamp_brin', table_name=table)
+        op.create_index(f'ix_{table}_timestamp_brin', table, ['timestamp'], postgresql_using='brin',
+                        postgresql_with={'autosummarize': 'on'})
+
+
+def downgrade() -> None:
+    for table in ('telemetry_data', 'auv_data'):
+        op.drop_index(f'ix_{table}_timestamp_brin', table_name=table)
+        op.create_index(f'ix_{table}_timestamp_brin', table, ['timestamp'], postgresql_using='brin')
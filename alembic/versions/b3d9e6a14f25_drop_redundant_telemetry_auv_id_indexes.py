@@ -0,0 +1,27 @@
+"""Drop redundant telemetry auv_id indexes
+
+Revision ID: b3d9e6a14f25
+Revises: f7a3d5b80c12
+Create Date: 2026-10-15 22:48:09.114207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b3d9e6a14f25'
+down_revision = 'f7a3d5b80c12'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # auv_id is the leading column of ix_<table>_auv_ts, which serves every auv_id lookup on its own
+    op.drop_index('ix_auv_data_auv_id', table_name='auv_data')
+    op.drop_index('ix_telemetry_data_auv_id', table_name='telemetry_data')
+
+
+def downgrade() -> None:
+    op.create_index('ix_telemetry_data_auv_id', 'telemetry_data', ['auv_id'], unique=False)
+    op.create_index('ix_auv_data_auv_id', 'auv_data', ['auv_id'], unique=False)
@@ -0,0 +1,109 @@
+"""Maintain telemetry hourly rollups on insert
+
+Revision ID: b7d3f9a25c61
+Revises: f4b8d2e61a93
+Create Date: 2026-10-16 11:02:37.914452
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d3f9a25c61'
+down_revision = 'f4b8d2e61a93'
+branch_labels = None
+depends_on = None
+
+
+ROLLUPS = {
+    'auv_data_hourly_rollup': ('auv_data', (
+        'latitude', 'longitude', 'depth', 'altitude', 'heading', 'speed',
+        'battery_level', 'temperature', 'pressure',
+    )),
+    'telemetry_data_hourly_rollup': ('telemetry_data', (
+        'water_temperature', 'salinity', 'ph_level', 'dissolved_oxygen', 'turbidity',
+        'current_speed', 'current_direction', 'data_quality_score',
+    )),
+}
+HOUR = "date_bin('1 hour', timestamp, TIMESTAMPTZ '2000-01-01 00:00:00+00')"
+
+
+def aggregates(metrics):
+    return ",\n               ".join(
+        f"min({m}) AS {m}_min, max({m}) AS {m}_max, sum({m}) AS {m}_sum, count({m}) AS {m}_count"
+        for m in metrics
+    )
+
+
+def upgrade() -> None:
+    for view, (source, metrics) in ROLLUPS.items():
+        op.execute(f"DROP MATERIALIZED VIEW {view}")
+        rollup_columns = ",\n                ".join(
+            f"{m}_min double precision, {m}_max double precision, {m}_sum double precision, {m}_count bigint NOT NULL"
+            for m in metrics
+        )
+        op.execute(f"""
+            CREATE TABLE {view} (
+                bucket timestamptz NOT NULL,
+                auv_id varchar(50) NOT NULL,
+                {rollup_columns},
+                PRIMARY KEY (bucket, auv_id)
+            )
+        """)
+        op.execute(f"""
+            INSERT INTO {view}
+            SELECT {HOUR} AS bucket,
+                   auv_id,
+                   {aggregates(metrics)}
+            FROM {source}
+            GROUP BY 1, 2
+        """)
+        
+        # Fold each INSERT statement's rows into their hours, so the rollup is exact without refreshes.
+        # Rows are upserted in key order so concurrent inserts lock rollup rows in the same order
+        merge = ",\n                    ".join(
+            f"{m}_min = LEAST(r.{m}_min, EXCLUDED.{m}_min), "
+            f"{m}_max = GREATEST(r.{m}_max, EXCLUDED.{m}_max), "
+            f"{m}_sum = COALESCE(r.{m}_sum + EXCLUDED.{m}_sum, r.{m}_sum, EXCLUDED.{m}_sum), "
+            f"{m}_count = r.{m}_count + EXCLUDED.{m}_count"
+            for m in metrics
+        )
+        op.execute(f"""
+            CREATE FUNCTION {view}_upsert() RETURNS trigger LANGUAGE plpgsql AS $$
+            BEGIN
+                INSERT INTO {view} AS r
+                SELECT {HOUR} AS bucket,
+                       auv_id,
+                       {aggregates(metrics)}
+                FROM new_rows
+                GROUP BY 1, 2
+                ORDER BY 1, 2
+                ON CONFLICT (bucket, auv_id) DO UPDATE SET
+                    {merge};
+                RETURN NULL;
+            END
+            $$
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {view}_upsert AFTER INSERT ON {source}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION {view}_upsert()
+        """)
+
+
+def downgrade() -> None:
+    for view, (source, metrics) in ROLLUPS.items():
+        op.execute(f"DROP TRIGGER {view}_upsert ON {source}")
+        op.execute(f"DROP FUNCTION {view}_upsert()")
+        op.execute(f"DROP TABLE {view}")
+        op.execute(f"""
+            CREATE MATERIALIZED VIEW {view} AS
+            SELECT {HOUR} AS bucket,
+                   auv_id,
+                   {aggregates(metrics)}
+            FROM {source}
+            WHERE timestamp < date_bin('1 hour', now(), TIMESTAMPTZ '2000-01-01 00:00:00+00')
+            GROUP BY 1, 2
+        """)
+        op.create_index(f'ix_{view}_key', view, ['bucket', 'auv_id'], unique=True)
@@ -0,0 +1,27 @@
+"""Drop redundant telemetry id indexes
+
+Revision ID: c2e7a94b1d58
+Revises: a9c4f1d27b63
+Create Date: 2026-10-16 09:41:27.508316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2e7a94b1d58'
+down_revision = 'a9c4f1d27b63'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # id is the leading column of the (id, timestamp) primary key, which serves every id lookup on its own
+    op.drop_index('ix_auv_data_id', table_name='auv_data')
+    op.drop_index('ix_telemetry_data_id', table_name='telemetry_data')
+
+
+def downgrade() -> None:
+    op.create_index('ix_telemetry_data_id', 'telemetry_data', ['id'], unique=False)
+    op.create_index('ix_auv_data_id', 'auv_data', ['id'], unique=False)
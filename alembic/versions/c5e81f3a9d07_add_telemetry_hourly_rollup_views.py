@@ -0,0 +1,54 @@
+"""Add telemetry hourly rollup materialized views
+
+Revision ID: c5e81f3a9d07
+Revises: a41c7e9d2b58
+Create Date: 2026-10-15 21:46:31.204417
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e81f3a9d07'
+down_revision = 'a41c7e9d2b58'
+branch_labels = None
+depends_on = None
+
+
+ROLLUPS = {
+    'auv_data_hourly_rollup': ('auv_data', (
+        'latitude', 'longitude', 'depth', 'altitude', 'heading', 'speed',
+        'battery_level', 'temperature', 'pressure',
+    )),
+    'telemetry_data_hourly_rollup': ('telemetry_data', (
+        'water_temperature', 'salinity', 'ph_level', 'dissolved_oxygen', 'turbidity',
+        'current_speed', 'current_direction', 'data_quality_score',
+    )),
+}
+
+
+def upgrade() -> None:
+    for view, (source, metrics) in ROLLUPS.items():
+        aggregates = ",\n               ".join(
+            f"min({m}) AS {m}_min, max({m}) AS {m}_max, sum({m}) AS {m}_sum, count({m}) AS {m}_count"
+            for m in metrics
+        )
+        # Only completed hours are rolled up; the current hour is always read from the raw table
+        op.execute(f"""
+            CREATE MATERIALIZED VIEW {view} AS
+            SELECT date_bin('1 hour', timestamp, TIMESTAMPTZ '2000-01-01 00:00:00+00') AS bucket,
+                   auv_id,
+                   {aggregates}
+            FROM {source}
+            WHERE timestamp < date_bin('1 hour', now(), TIMESTAMPTZ '2000-01-01 00:00:00+00')
+            GROUP BY 1, 2
+        """)
+        # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+        op.create_index(f'ix_{view}_key', view, ['bucket', 'auv_id'], unique=True)
+
+
+def downgrade() -> None:
+    for view in reversed(list(ROLLUPS)):
+        op.drop_index(f'ix_{view}_key', table_name=view)
+        op.execute(f"DROP MATERIALIZED VIEW {view}")
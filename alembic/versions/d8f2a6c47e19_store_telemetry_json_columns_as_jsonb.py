@@ -0,0 +1,32 @@
+"""Store telemetry JSON columns as JSONB
+
+Revision ID: d8f2a6c47e19
+Revises: b3d9e6a14f25
+Create Date: 2026-10-15 23:31:42.508316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8f2a6c47e19'
+down_revision = 'b3d9e6a14f25'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Rewrites each partition once; the parent ALTER recurses into them
+    op.alter_column('auv_data', 'telemetry_data', type_=postgresql.JSONB(), existing_type=sa.JSON(),
+                    postgresql_using='telemetry_data::jsonb')
+    op.alter_column('telemetry_data', 'sensor_data', type_=postgresql.JSONB(), existing_type=sa.JSON(),
+                    postgresql_using='sensor_data::jsonb')
+
+
+def downgrade() -> None:
+    op.alter_column('telemetry_data', 'sensor_data', type_=sa.JSON(), existing_type=postgresql.JSONB(),
+                    postgresql_using='sensor_data::json')
+    op.alter_column('auv_data', 'telemetry_data', type_=sa.JSON(), existing_type=postgresql.JSONB(),
+                    postgresql_using='telemetry_data::json')
@@ -0,0 +1,106 @@
+"""Partition telemetry tables by month
+
+Revision ID: e2b96d4c1f30
+Revises: c5e81f3a9d07
+Create Date: 2026-10-15 21:58:44.906215
+
+"""
+from datetime import datetime, timezone
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e2b96d4c1f30'
+down_revision = 'c5e81f3a9d07'
+branch_labels = None
+depends_on = None
+
+
+# Each table with its hourly rollup view and rolled-up metrics; the views depend on
+# the tables and are rebuilt around the swap
+TABLES = {
+    'auv_data': ('auv_data_hourly_rollup', (
+        'latitude', 'longitude', 'depth', 'altitude', 'heading', 'speed',
+        'battery_level', 'temperature', 'pressure',
+    )),
+    'telemetry_data': ('telemetry_data_hourly_rollup', (
+        'water_temperature', 'salinity', 'ph_level', 'dissolved_oxygen', 'turbidity',
+        'current_speed', 'current_direction', 'data_quality_score',
+    )),
+}
+INDEXES = ('id', 'auv_id', 'timestamp')
+
+
+def month_start(value, months_ahead=0):
+    month = value.month - 1 + months_ahead
+    return datetime(value.year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def create_rollup_view(view, source, metrics):
+    aggregates = ",\n               ".join(
+        f"min({m}) AS {m}_min, max({m}) AS {m}_max, sum({m}) AS {m}_sum, count({m}) AS {m}_count"
+        for m in metrics
+    )
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW {view} AS
+        SELECT date_bin('1 hour', timestamp, TIMESTAMPTZ '2000-01-01 00:00:00+00') AS bucket,
+               auv_id,
+               {aggregates}
+        FROM {source}
+        WHERE timestamp < date_bin('1 hour', now(), TIMESTAMPTZ '2000-01-01 00:00:00+00')
+        GROUP BY 1, 2
+    """)
+    op.create_index(f'ix_{view}_key', view, ['bucket', 'auv_id'], unique=True)
+
+
+def swap_table(table, partitioned):
+    """Rebuild table (partitioned by month or plain) and move its rows and id sequence across"""
+    old = f'{table}_old'
+    op.execute(f"ALTER TABLE {table} RENAME TO {old}")
+    op.execute(f"ALTER INDEX {table}_pkey RENAME TO {old}_pkey")
+    for index in (*INDEXES, 'auv_ts'):
+        op.drop_index(f'ix_{table}_{index}', table_name=old)
+    
+    if partitioned:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS) PARTITION BY RANGE (timestamp)")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, timestamp)")
+        # Monthly partitions from the oldest row through next month, plus a catch-all DEFAULT
+        oldest = op.get_bind().execute(sa.text(f"SELECT min(timestamp) FROM {old}")).scalar()
+        now = datetime.now(timezone.utc)
+        month = month_start(min(oldest, now) if oldest else now)
+        while month < month_start(now, 2):
+            following = month_start(month, 1)
+            op.execute(
+                f"CREATE TABLE {table}_{month:%Y%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+            )
+            month = following
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+    else:
+        op.execute(f"CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS)")
+        op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)")
+    
+    op.execute(f"INSERT INTO {table} SELECT * FROM {old}")
+    # Keep the id sequence alive when the old table is dropped
+    op.execute(f"ALTER SEQUENCE {table}_id_seq OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {old}")
+    
+    for index in INDEXES:
+        op.create_index(f'ix_{table}_{index}', table, [index])
+    op.create_index(f'ix_{table}_auv_ts', table, ['auv_id', sa.text('timestamp DESC')])
+
+
+def upgrade() -> None:
+    for table, (view, metrics) in TABLES.items():
+        op.execute(f"DROP MATERIALIZED VIEW {view}")
+        swap_table(table, partitioned=True)
+        create_rollup_view(view, table, metrics)
+
+
+def downgrade() -> None:
+    for table, (view, metrics) in TABLES.items():
+        op.execute(f"DROP MATERIALIZED VIEW {view}")
+        # Partitions are dropped along with the old parent table
+        swap_table(table, partitioned=False)
+        create_rollup_view(view, table, metrics)
@@ -0,0 +1,38 @@
+"""Replace single-column alert indexes
+
+Revision ID: e6c1b8f35a72
+Revises: d8f2a6c47e19
+Create Date: 2026-10-15 23:44:18.902651
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6c1b8f35a72'
+down_revision = 'd8f2a6c47e19'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Per-AUV listings across all statuses, newest first, without a sort
+        op.create_index(
+            'ix_alerts_auv_ts',
+            'alerts',
+            ['auv_id', sa.text('timestamp DESC')],
+            postgresql_concurrently=True
+        )
+        # Leading columns of ix_alerts_auv_ts and ix_alerts_timestamp_id cover these
+        op.drop_index('ix_alerts_auv_id', table_name='alerts', postgresql_concurrently=True)
+        op.drop_index('ix_alerts_timestamp', table_name='alerts', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('ix_alerts_timestamp', 'alerts', ['timestamp'], postgresql_concurrently=True)
+        op.create_index('ix_alerts_auv_id', 'alerts', ['auv_id'], postgresql_concurrently=True)
+        op.drop_index('ix_alerts_auv_ts', table_name='alerts', postgresql_concurrently=True)
@@ -0,0 +1,47 @@
+"""Bucket alert daily rollup in UTC
+
+Revision ID: f4b8d2e61a93
+Revises: c2e7a94b1d58
+Create Date: 2026-10-16 10:18:52.337104
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f4b8d2e61a93'
+down_revision = 'c2e7a94b1d58'
+branch_labels = None
+depends_on = None
+
+
+def create_view(day):
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW alert_daily_rollup AS
+        SELECT {day} AS day,
+               auv_id,
+               severity,
+               alert_type,
+               count(*) AS alert_count
+        FROM alerts
+        GROUP BY 1, 2, 3, 4
+    """)
+    # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+    op.create_index(
+        'ix_alert_daily_rollup_key',
+        'alert_daily_rollup',
+        ['day', 'auv_id', 'severity', 'alert_type'],
+        unique=True
+    )
+
+
+def upgrade() -> None:
+    # Days were cut in the refreshing session's time zone; pin them to UTC like the API's bounds
+    op.execute("DROP MATERIALIZED VIEW alert_daily_rollup")
+    create_view("date_trunc('day', timestamp, 'UTC')")
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW alert_daily_rollup")
+    create_view("date_trunc('day', timestamp)")
@@ -0,0 +1,27 @@
+"""Add telemetry timestamp BRIN indexes
+
+Revision ID: f7a3d5b80c12
+Revises: e2b96d4c1f30
+Create Date: 2026-10-15 22:05:17.331960
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f7a3d5b80c12'
+down_revision = 'e2b96d4c1f30'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Partitioned parents do not support CREATE INDEX CONCURRENTLY; BRIN builds are quick regardless
+    op.create_index('ix_auv_data_timestamp_brin', 'auv_data', ['timestamp'], postgresql_using='brin')
+    op.create_index('ix_telemetry_data_timestamp_brin', 'telemetry_data', ['timestamp'], postgresql_using='brin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_telemetry_data_timestamp_brin', table_name='telemetry_data')
+    op.drop_index('ix_auv_data_timestamp_brin', table_name='auv_data')
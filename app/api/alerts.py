@@ -1,54 +1,114 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime, timedelta
-from app.database import get_db
-from app.models.alerts import Alert, AlertSeverity, AlertType, AlertStatus
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from typing import List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import base64
+from app.database import get_async_db
+from app.streaming import stream_json_array
+from app.models.alerts import Alert, AlertSeverity, AlertType, AlertStatus, alert_daily_rollup
 from app.schemas.alerts import (
     AlertCreate, AlertUpdate, AlertResponse,
     AlertQueryParams, AlertSummary, AlertFeedResponse,
     BulkAcknowledgeRequest, BulkResolveRequest
 )
-from sqlalchemy import and_, or_, func, desc, text
-import redis
-from app.config import settings
+from sqlalchemy import and_, or_, func, desc, text, tuple_, select, insert, union_all, cast, update, bindparam, Integer
+from app.redis_batcher import publisher
 
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
-# Redis connection for real-time alerts
-redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+# Point-lookup statements built once and bound per request, so their compiled form is reused
+ALERT_BY_ID = select(Alert).where(Alert.id == bindparam("alert_id"))
+ALERT_ID_BY_ID = select(Alert.id).where(Alert.id == bindparam("alert_id"))
+
+# Status of the row as it was before the enclosing UPDATE, for use in its RETURNING clause
+_previous_alert = aliased(Alert)
+ALERT_OLD_STATUS = select(_previous_alert.status).where(_previous_alert.id == Alert.id).scalar_subquery()
+
+# Enum values computed once; summaries start from these so every bucket is present
+_ALERT_TYPE_VALUES = tuple(alert_type_enum.value for alert_type_enum in AlertType)
+_SEVERITY_VALUES = tuple(severity_enum.value for severity_enum in AlertSeverity)
+
+
+# Keyset pagination helpers
+def encode_cursor(alert) -> str:
+    """Encode the (timestamp, id) position of an alert as an opaque cursor"""
+    raw = f"{alert.timestamp.isoformat()}|{alert.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, alert_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(timestamp), int(alert_id)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def utc_day(value: datetime) -> datetime:
+    """Midnight UTC starting the day of an aware datetime"""
+    return value.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+async def paginate_alerts(db: AsyncSession, query, cursor: Optional[str], skip: int, limit: int) -> Tuple[list, Optional[str]]:
+    """Fetch one page of alerts ordered newest first, seeking past the cursor if given"""
+    if cursor:
+        cursor_timestamp, cursor_id = decode_cursor(cursor)
+        query = query.where(tuple_(Alert.timestamp, Alert.id) < (cursor_timestamp, cursor_id))
+    
+    # Fetch one extra row to find out whether another page exists
+    result = await db.execute(query.order_by(desc(Alert.timestamp), desc(Alert.id)).offset(skip).limit(limit + 1))
+    alerts = result.all()
+    if len(alerts) > limit:
+        alerts = alerts[:limit]
+        return alerts, encode_cursor(alerts[-1])
+    return alerts, None
+
+
+# Plain column rows for list endpoints; serialized without ORM hydration or response_model validation
+ALERT_COLUMNS = tuple(Alert.__table__.columns)
+
+
+def alert_rows_response(rows, next_cursor: Optional[str] = None) -> ORJSONResponse:
+    """Encode alert rows directly with orjson, passing the next cursor as a header"""
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return ORJSONResponse([row._asdict() for row in rows], headers=headers)
 
 
 # Alert CRUD Endpoints
 @router.post("/", response_model=AlertResponse)
-def create_alert(
+async def create_alert(
     alert: AlertCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new alert"""
-    db_alert = Alert(**alert.dict())
-    db.add(db_alert)
-    db.commit()
-    db.refresh(db_alert)
+    # RETURNING hands back server defaults (id, created_at) without a follow-up SELECT
+    result = await db.execute(insert(Alert).values(**alert.dict()).returning(Alert))
+    db_alert = result.scalar_one()
+    await db.commit()
     
-    # Publish to Redis for real-time subscribers
+    # Queue for real-time subscribers; published in batches off the request path
     alert_data = {
         "type": "new_alert",
         "alert_id": db_alert.id,
         "auv_id": db_alert.auv_id,
-        "severity": db_alert.severity.value,
-        "alert_type": db_alert.alert_type.value,
+        "severity": db_alert.severity,
+        "alert_type": db_alert.alert_type,
         "title": db_alert.title,
-        "timestamp": db_alert.timestamp.isoformat()
+        "timestamp": db_alert.timestamp
     }
-    redis_client.publish("alerts:new", str(alert_data))
+    publisher.publish("alerts:new", alert_data)
     
     return db_alert
 
 
 @router.get("/", response_model=List[AlertResponse])
-def get_alerts(
-    skip: int = Query(0, ge=0, description="Number of records to skip", example=0),
+async def get_alerts(
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (prefer cursor for deep pages)", example=0),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return", example=100),
     auv_id: Optional[str] = Query(None, description="Filter by AUV ID", example="AUV-001"),
     alert_type: Optional[AlertType] = Query(None, description="Filter by alert type", example=AlertType.ENVIRONMENTAL),
@@ -57,191 +117,201 @@ def get_alerts(
     start_time: Optional[datetime] = Query(None, description="Start time for query", example="2025-08-10T00:00:00"),
     end_time: Optional[datetime] = Query(None, description="End time for query", example="2025-08-15T23:59:59"),
     search: Optional[str] = Query(None, description="Search in title and description", example="battery"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get alerts with filtering and pagination"""
-    query = db.query(Alert)
+    query = select(*ALERT_COLUMNS)
     
     if auv_id:
-        query = query.filter(Alert.auv_id == auv_id)
+        query = query.where(Alert.auv_id == auv_id)
     if alert_type:
-        query = query.filter(Alert.alert_type == alert_type)
+        query = query.where(Alert.alert_type == alert_type)
     if severity:
-        query = query.filter(Alert.severity == severity)
+        query = query.where(Alert.severity == severity)
     if status:
-        query = query.filter(Alert.status == status)
+        query = query.where(Alert.status == status)
     if start_time:
-        query = query.filter(Alert.timestamp >= start_time)
+        query = query.where(Alert.timestamp >= start_time)
     if end_time:
-        query = query.filter(Alert.timestamp <= end_time)
+        query = query.where(Alert.timestamp <= end_time)
     if search:
         search_filter = or_(
             Alert.title.ilike(f"%{search}%"),
             Alert.description.ilike(f"%{search}%"),
             Alert.message.ilike(f"%{search}%")
         )
-        query = query.filter(search_filter)
+        query = query.where(search_filter)
     
-    alerts = query.order_by(desc(Alert.timestamp)).offset(skip).limit(limit).all()
-    return alerts
+    alerts, next_cursor = await paginate_alerts(db, query, cursor, skip, limit)
+    return alert_rows_response(alerts, next_cursor)
 
 
 @router.get("/{alert_id}", response_model=AlertResponse)
-def get_alert(alert_id: int, db: Session = Depends(get_db)):
+async def get_alert(alert_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific alert by ID"""
-    alert = db.query(Alert).filter(Alert.id == alert_id).first()
+    alert = (await db.execute(ALERT_BY_ID, {"alert_id": alert_id})).scalar_one_or_none()
     if not alert:
         raise HTTPException(status_code=404, detail=f"Alert with ID {alert_id} not found")
     return alert
 
 
 @router.put("/{alert_id}", response_model=AlertResponse)
-def update_alert(
+async def update_alert(
     alert_id: int,
     alert_update: AlertUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an alert"""
-    db_alert = db.query(Alert).filter(Alert.id == alert_id).first()
-    if not db_alert:
-        raise HTTPException(status_code=404, detail=f"Alert with ID {alert_id} not found")
-    
     update_data = alert_update.dict(exclude_unset=True)
-    
-    # Handle status changes
-    if 'status' in update_data:
-        if update_data['status'] == AlertStatus.ACKNOWLEDGED and not db_alert.acknowledged_at:
-            update_data['acknowledged_at'] = datetime.utcnow()
-        elif update_data['status'] == AlertStatus.RESOLVED and not db_alert.resolved_at:
-            update_data['resolved_at'] = datetime.utcnow()
-    
-    for field, value in update_data.items():
-        setattr(db_alert, field, value)
-    
-    db.commit()
-    db.refresh(db_alert)
+    if not update_data:
+        db_alert = (await db.execute(ALERT_BY_ID, {"alert_id": alert_id})).scalar_one_or_none()
+        if not db_alert:
+            raise HTTPException(status_code=404, detail=f"Alert with ID {alert_id} not found")
+        return db_alert
+    
+    # Handle status changes; keep the first acknowledge/resolve time
+    if update_data.get('status') is not None:
+        update_data['status'] = AlertStatus(update_data['status'].value)
+        if update_data['status'] == AlertStatus.ACKNOWLEDGED:
+            update_data['acknowledged_at'] = func.coalesce(Alert.acknowledged_at, func.now())
+        elif update_data['status'] == AlertStatus.RESOLVED:
+            update_data['resolved_at'] = func.coalesce(Alert.resolved_at, func.now())
+    
+    # Single UPDATE ... RETURNING; the subquery reads the pre-update snapshot for the old status
+    result = await db.execute(
+        update(Alert)
+        .where(Alert.id == alert_id)
+        .values(**update_data)
+        .returning(Alert, ALERT_OLD_STATUS)
+        .execution_options(synchronize_session=False)
+    )
+    row = result.one_or_none()
+    if row is None:
+        raise HTTPException(status_code=404, detail=f"Alert with ID {alert_id} not found")
+    db_alert, old_status = row
+    await db.commit()
     
     # Publish status change to Redis
     status_data = {
         "type": "alert_status_change",
         "alert_id": db_alert.id,
         "auv_id": db_alert.auv_id,
-        "old_status": db_alert.status.value,
-        "new_status": update_data.get('status', db_alert.status.value)
+        "old_status": old_status,
+        "new_status": db_alert.status
     }
-    redis_client.publish("alerts:status_change", str(status_data))
+    publisher.publish("alerts:status_change", status_data)
     
     return db_alert
 
 
 @router.delete("/{alert_id}")
-def delete_alert(alert_id: int, db: Session = Depends(get_db)):
+async def delete_alert(alert_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete an alert"""
-    db_alert = db.query(Alert).filter(Alert.id == alert_id).first()
+    db_alert = (await db.execute(ALERT_BY_ID, {"alert_id": alert_id})).scalar_one_or_none()
     if not db_alert:
         raise HTTPException(status_code=404, detail=f"Alert with ID {alert_id} not found")
     
-    db.delete(db_alert)
-    db.commit()
+    await db.delete(db_alert)
+    await db.commit()
     return {"message": "Alert deleted successfully"}
 
 
 # Alert Feed and Summary Endpoints
 @router.get("/feed/", response_model=AlertFeedResponse)
-def get_alert_feed(
-    skip: int = Query(0, ge=0, description="Number of records to skip", example=0),
+async def get_alert_feed(
+    cursor: Optional[str] = Query(None, description="Cursor from next_cursor of the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip (prefer cursor for deep pages)", example=0),
     limit: int = Query(50, ge=1, le=200, description="Number of records to return", example=50),
     auv_id: Optional[str] = Query(None, description="Filter by AUV ID", example="AUV-001"),
     alert_type: Optional[AlertType] = Query(None, description="Filter by alert type", example=AlertType.ENVIRONMENTAL),
     severity: Optional[AlertSeverity] = Query(None, description="Filter by severity", example=AlertSeverity.MEDIUM),
     status: Optional[AlertStatus] = Query(None, description="Filter by status", example=AlertStatus.ACTIVE),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get alert feed with summary statistics"""
     # Build query for alerts
-    query = db.query(Alert)
+    query = select(*ALERT_COLUMNS)
     
     if auv_id:
-        query = query.filter(Alert.auv_id == auv_id)
+        query = query.where(Alert.auv_id == auv_id)
     if alert_type:
-        query = query.filter(Alert.alert_type == alert_type)
+        query = query.where(Alert.alert_type == alert_type)
     if severity:
-        query = query.filter(Alert.severity == severity)
+        query = query.where(Alert.severity == severity)
     if status:
-        query = query.filter(Alert.status == status)
-    
-    # Get total count for pagination
-    total_count = query.count()
+        query = query.where(Alert.status == status)
     
     # Get alerts
-    alerts = query.order_by(desc(Alert.timestamp)).offset(skip).limit(limit).all()
+    alerts, next_cursor = await paginate_alerts(db, query, cursor, skip, limit)
     
-    # Calculate summary statistics
-    summary = get_alert_summary(db, auv_id, alert_type, severity, status)
+    # Calculate summary statistics; it is grouped over the same filters, so its
+    # total doubles as the pagination count without a separate COUNT scan
+    summary = await get_alert_summary(db, auv_id, alert_type, severity, status)
     
     return AlertFeedResponse(
         alerts=alerts,
         summary=summary,
-        total_count=total_count,
-        has_more=(skip + limit) < total_count
+        total_count=summary.total_alerts,
+        has_more=next_cursor is not None,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/summary/", response_model=AlertSummary)
-def get_alert_summary_endpoint(
+async def get_alert_summary_endpoint(
     auv_id: Optional[str] = Query(None, description="Filter by AUV ID", example="AUV-001"),
     alert_type: Optional[AlertType] = Query(None, description="Filter by alert type", example=AlertType.ENVIRONMENTAL),
     severity: Optional[AlertSeverity] = Query(None, description="Filter by severity", example=AlertSeverity.MEDIUM),
     status: Optional[AlertStatus] = Query(None, description="Filter by status", example=AlertStatus.ACTIVE),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get alert summary statistics"""
-    return get_alert_summary(db, auv_id, alert_type, severity, status)
+    return await get_alert_summary(db, auv_id, alert_type, severity, status)
 
 
-def get_alert_summary(
-    db: Session,
+async def get_alert_summary(
+    db: AsyncSession,
     auv_id: Optional[str] = None,
     alert_type: Optional[AlertType] = None,
     severity: Optional[AlertSeverity] = None,
     status: Optional[AlertStatus] = None
 ) -> AlertSummary:
     """Helper function to calculate alert summary statistics"""
-    base_query = db.query(Alert)
+    query = select(
+        Alert.status,
+        Alert.severity,
+        Alert.alert_type,
+        func.count().label('count')
+    )
     
     # Apply filters
     if auv_id:
-        base_query = base_query.filter(Alert.auv_id == auv_id)
+        query = query.where(Alert.auv_id == auv_id)
     if alert_type:
-        base_query = base_query.filter(Alert.alert_type == alert_type)
+        query = query.where(Alert.alert_type == alert_type)
     if severity:
-        base_query = base_query.filter(Alert.severity == severity)
+        query = query.where(Alert.severity == severity)
     if status:
-        base_query = base_query.filter(Alert.status == status)
-    
-    # Get total alerts
-    total_alerts = base_query.count()
-    
-    # Get status counts
-    active_alerts = base_query.filter(Alert.status == AlertStatus.ACTIVE).count()
-    acknowledged_alerts = base_query.filter(Alert.status == AlertStatus.ACKNOWLEDGED).count()
-    resolved_alerts = base_query.filter(Alert.status == AlertStatus.RESOLVED).count()
-    
-    # Get severity counts
-    critical_alerts = base_query.filter(Alert.severity == AlertSeverity.CRITICAL).count()
-    high_severity_alerts = base_query.filter(Alert.severity == AlertSeverity.HIGH).count()
-    
-    # Get alerts by type
-    alerts_by_type = {}
-    for alert_type_enum in AlertType:
-        count = base_query.filter(Alert.alert_type == alert_type_enum).count()
-        alerts_by_type[alert_type_enum.value] = count
-    
-    # Get alerts by severity
-    alerts_by_severity = {}
-    for severity_enum in AlertSeverity:
-        count = base_query.filter(Alert.severity == severity_enum).count()
-        alerts_by_severity[severity_enum.value] = count
+        query = query.where(Alert.status == status)
+    
+    # One grouped scan instead of a COUNT per status/severity/type
+    rows = (await db.execute(query.group_by(Alert.status, Alert.severity, Alert.alert_type))).all()
+    
+    total_alerts = 0
+    alerts_by_status = {}
+    alerts_by_type = dict.fromkeys(_ALERT_TYPE_VALUES, 0)
+    alerts_by_severity = dict.fromkeys(_SEVERITY_VALUES, 0)
+    for row in rows:
+        total_alerts += row.count
+        alerts_by_status[row.status] = alerts_by_status.get(row.status, 0) + row.count
+        alerts_by_type[row.alert_type.value] += row.count
+        alerts_by_severity[row.severity.value] += row.count
+    
+    active_alerts = alerts_by_status.get(AlertStatus.ACTIVE, 0)
+    acknowledged_alerts = alerts_by_status.get(AlertStatus.ACKNOWLEDGED, 0)
+    resolved_alerts = alerts_by_status.get(AlertStatus.RESOLVED, 0)
+    critical_alerts = alerts_by_severity[AlertSeverity.CRITICAL.value]
+    high_severity_alerts = alerts_by_severity[AlertSeverity.HIGH.value]
     
     return AlertSummary(
         total_alerts=total_alerts,
@@ -257,58 +327,78 @@ def get_alert_summary(
 
 # AUV-specific Alert Endpoints
 @router.get("/auv/{auv_id}/", response_model=List[AlertResponse])
-def get_auv_alerts(
+async def get_auv_alerts(
     auv_id: str,
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     alert_type: Optional[AlertType] = Query(None),
     severity: Optional[AlertSeverity] = Query(None),
     status: Optional[AlertStatus] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all alerts for a specific AUV"""
-    query = db.query(Alert).filter(Alert.auv_id == auv_id)
+    query = select(*ALERT_COLUMNS).where(Alert.auv_id == auv_id)
     
     if alert_type:
-        query = query.filter(Alert.alert_type == alert_type)
+        query = query.where(Alert.alert_type == alert_type)
     if severity:
-        query = query.filter(Alert.severity == severity)
+        query = query.where(Alert.severity == severity)
     if status:
-        query = query.filter(Alert.status == status)
+        query = query.where(Alert.status == status)
     
-    alerts = query.order_by(desc(Alert.timestamp)).offset(skip).limit(limit).all()
-    return alerts
+    alerts, next_cursor = await paginate_alerts(db, query, cursor, skip, limit)
+    return alert_rows_response(alerts, next_cursor)
 
 
 @router.get("/auv/{auv_id}/summary", response_model=AlertSummary)
-def get_auv_alert_summary(auv_id: str, db: Session = Depends(get_db)):
+async def get_auv_alert_summary(auv_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get alert summary for a specific AUV"""
-    return get_alert_summary(db, auv_id=auv_id)
+    return await get_alert_summary(db, auv_id=auv_id)
 
 
 @router.get("/auv/{auv_id}/active", response_model=List[AlertResponse])
-def get_auv_active_alerts(auv_id: str, db: Session = Depends(get_db)):
+async def get_auv_active_alerts(
+    auv_id: str,
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(500, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db)
+):
     """Get active alerts for a specific AUV"""
-    alerts = db.query(Alert).filter(
+    query = select(*ALERT_COLUMNS).where(
+        and_(
+            Alert.auv_id == auv_id,
+            Alert.status == AlertStatus.ACTIVE
+        )
+    )
+    alerts, next_cursor = await paginate_alerts(db, query, cursor, skip, limit)
+    return alert_rows_response(alerts, next_cursor)
+
+
+@router.get("/auv/{auv_id}/active/stream", response_model=List[AlertResponse])
+async def stream_auv_active_alerts(auv_id: str):
+    """Stream every active alert for a specific AUV as a JSON array without buffering the full result"""
+    query = select(*ALERT_COLUMNS).where(
         and_(
             Alert.auv_id == auv_id,
             Alert.status == AlertStatus.ACTIVE
         )
-    ).order_by(desc(Alert.timestamp)).all()
-    return alerts
+    ).order_by(desc(Alert.timestamp), desc(Alert.id))
+    return stream_json_array(query)
 
 
 # Bulk Operations (must come before single alert endpoints to avoid routing conflicts)
 @router.post("/bulk/acknowledge")
-def bulk_acknowledge_alerts(
+async def bulk_acknowledge_alerts(
     request: BulkAcknowledgeRequest,
     acknowledged_by: str = Query(..., description="User acknowledging the alerts", example="operator_john"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Bulk acknowledge multiple alerts"""
-    alerts = db.query(Alert).filter(Alert.id.in_(request.alert_ids)).all()
+    found_ids = set((await db.execute(select(Alert.id).where(Alert.id.in_(request.alert_ids)))).scalars())
     
-    if not alerts:
+    if not found_ids:
         return {
             "message": "No alerts found with the provided IDs",
             "acknowledged_count": 0,
@@ -318,23 +408,34 @@ def bulk_acknowledge_alerts(
         }
     
     # Find which alert IDs were not found
-    found_ids = [alert.id for alert in alerts]
     not_found_ids = [aid for aid in request.alert_ids if aid not in found_ids]
     
-    acknowledged_count = 0
-    for alert in alerts:
-        if alert.status != AlertStatus.ACKNOWLEDGED:
-            alert.status = AlertStatus.ACKNOWLEDGED
-            alert.acknowledged_by = acknowledged_by
-            alert.acknowledged_at = datetime.utcnow()
-            acknowledged_count += 1
-    
-    db.commit()
+    # One set-based UPDATE instead of loading and flushing each alert
+    stmt = update(Alert).where(
+        Alert.id.in_(found_ids),
+        Alert.status.is_distinct_from(AlertStatus.ACKNOWLEDGED)
+    ).values(
+        status=AlertStatus.ACKNOWLEDGED,
+        acknowledged_by=acknowledged_by,
+        acknowledged_at=func.now()
+    ).returning(Alert.id, Alert.auv_id).execution_options(synchronize_session=False)
+    acknowledged = (await db.execute(stmt)).all()
+    await db.commit()
+    
+    # One aggregated event for the whole batch
+    if acknowledged:
+        publisher.publish("alerts:acknowledged_bulk", {
+            "type": "alerts_acknowledged_bulk",
+            "alert_ids": [alert.id for alert in acknowledged],
+            "auv_ids": sorted({alert.auv_id for alert in acknowledged}),
+            "acknowledged_by": acknowledged_by
+        })
+    acknowledged_count = len(acknowledged)
     
     response = {
         "message": f"Successfully acknowledged {acknowledged_count} alerts",
         "acknowledged_count": acknowledged_count,
-        "total_alerts": len(alerts),
+        "total_alerts": len(found_ids),
         "status": "success"
     }
     
@@ -346,16 +447,16 @@ def bulk_acknowledge_alerts(
 
 
 @router.post("/bulk/resolve")
-def bulk_resolve_alerts(
+async def bulk_resolve_alerts(
     request: BulkResolveRequest,
     resolved_by: str = Query(..., description="User resolving the alerts", example="operator_jane"),
     resolution_notes: Optional[str] = Query(None, description="Resolution notes", example="Fixed sensor calibration issue"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Bulk resolve multiple alerts"""
-    alerts = db.query(Alert).filter(Alert.id.in_(request.alert_ids)).all()
+    found_ids = set((await db.execute(select(Alert.id).where(Alert.id.in_(request.alert_ids)))).scalars())
     
-    if not alerts:
+    if not found_ids:
         return {
             "message": "No alerts found with the provided IDs",
             "resolved_count": 0,
@@ -365,25 +466,38 @@ def bulk_resolve_alerts(
         }
     
     # Find which alert IDs were not found
-    found_ids = [alert.id for alert in alerts]
     not_found_ids = [aid for aid in request.alert_ids if aid not in found_ids]
     
-    resolved_count = 0
-    for alert in alerts:
-        if alert.status != AlertStatus.RESOLVED:
-            alert.status = AlertStatus.RESOLVED
-            alert.resolved_by = resolved_by
-            alert.resolved_at = datetime.utcnow()
-            if resolution_notes:
-                alert.resolution_notes = resolution_notes
-            resolved_count += 1
-    
-    db.commit()
+    values = {
+        "status": AlertStatus.RESOLVED,
+        "resolved_by": resolved_by,
+        "resolved_at": func.now()
+    }
+    if resolution_notes:
+        values["resolution_notes"] = resolution_notes
+    
+    # One set-based UPDATE instead of loading and flushing each alert
+    stmt = update(Alert).where(
+        Alert.id.in_(found_ids),
+        Alert.status.is_distinct_from(AlertStatus.RESOLVED)
+    ).values(**values).returning(Alert.id, Alert.auv_id).execution_options(synchronize_session=False)
+    resolved = (await db.execute(stmt)).all()
+    await db.commit()
+    
+    # One aggregated event for the whole batch
+    if resolved:
+        publisher.publish("alerts:resolved_bulk", {
+            "type": "alerts_resolved_bulk",
+            "alert_ids": [alert.id for alert in resolved],
+            "auv_ids": sorted({alert.auv_id for alert in resolved}),
+            "resolved_by": resolved_by
+        })
+    resolved_count = len(resolved)
     
     response = {
         "message": f"Successfully resolved {resolved_count} alerts",
         "resolved_count": resolved_count,
-        "total_alerts": len(alerts),
+        "total_alerts": len(found_ids),
         "status": "success"
     }
     
@@ -395,26 +509,34 @@ def bulk_resolve_alerts(
 
 
 # Alert Management Endpoints
+async def raise_unchanged_alert(db: AsyncSession, alert_id: int, conflict_detail: str):
+    """Explain why a conditional status UPDATE matched no row: missing alert (404) or status already set (400)"""
+    if await db.scalar(ALERT_ID_BY_ID, {"alert_id": alert_id}) is None:
+        raise HTTPException(status_code=404, detail=f"Alert with ID {alert_id} not found")
+    raise HTTPException(status_code=400, detail=conflict_detail)
+
+
 @router.post("/{alert_id}/acknowledge", response_model=AlertResponse)
-def acknowledge_alert(
+async def acknowledge_alert(
     alert_id: int,
     acknowledged_by: str = Query(..., description="User acknowledging the alert"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Acknowledge an alert"""
-    db_alert = db.query(Alert).filter(Alert.id == alert_id).first()
-    if not db_alert:
-        raise HTTPException(status_code=404, detail=f"Alert with ID {alert_id} not found")
-    
-    if db_alert.status == AlertStatus.ACKNOWLEDGED:
-        raise HTTPException(status_code=400, detail="Alert already acknowledged")
-    
-    db_alert.status = AlertStatus.ACKNOWLEDGED
-    db_alert.acknowledged_by = acknowledged_by
-    db_alert.acknowledged_at = datetime.utcnow()
-    
-    db.commit()
-    db.refresh(db_alert)
+    # Conditional UPDATE: the status check and the write happen atomically in one round-trip
+    stmt = update(Alert).where(
+        Alert.id == alert_id,
+        Alert.status.is_distinct_from(AlertStatus.ACKNOWLEDGED)
+    ).values(
+        status=AlertStatus.ACKNOWLEDGED,
+        acknowledged_by=acknowledged_by,
+        acknowledged_at=func.now()
+    ).returning(Alert)
+    db_alert = (await db.execute(stmt)).scalar_one_or_none()
+    
+    if db_alert is None:
+        await raise_unchanged_alert(db, alert_id, "Alert already acknowledged")
+    await db.commit()
     
     # Publish to Redis
     status_data = {
@@ -423,34 +545,37 @@ def acknowledge_alert(
         "auv_id": db_alert.auv_id,
         "acknowledged_by": acknowledged_by
     }
-    redis_client.publish("alerts:acknowledged", str(status_data))
+    publisher.publish("alerts:acknowledged", status_data)
     
     return db_alert
 
 
 @router.post("/{alert_id}/resolve", response_model=AlertResponse)
-def resolve_alert(
+async def resolve_alert(
     alert_id: int,
     resolved_by: str = Query(..., description="User resolving the alert"),
     resolution_notes: Optional[str] = Query(None, description="Resolution notes"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Resolve an alert"""
-    db_alert = db.query(Alert).filter(Alert.id == alert_id).first()
-    if not db_alert:
-        raise HTTPException(status_code=404, detail=f"Alert with ID {alert_id} not found")
-    
-    if db_alert.status == AlertStatus.RESOLVED:
-        raise HTTPException(status_code=400, detail="Alert already resolved")
-    
-    db_alert.status = AlertStatus.RESOLVED
-    db_alert.resolved_by = resolved_by
-    db_alert.resolved_at = datetime.utcnow()
+    values = {
+        "status": AlertStatus.RESOLVED,
+        "resolved_by": resolved_by,
+        "resolved_at": func.now()
+    }
     if resolution_notes:
-        db_alert.resolution_notes = resolution_notes
+        values["resolution_notes"] = resolution_notes
     
-    db.commit()
-    db.refresh(db_alert)
+    # Conditional UPDATE: the status check and the write happen atomically in one round-trip
+    stmt = update(Alert).where(
+        Alert.id == alert_id,
+        Alert.status.is_distinct_from(AlertStatus.RESOLVED)
+    ).values(**values).returning(Alert)
+    db_alert = (await db.execute(stmt)).scalar_one_or_none()
+    
+    if db_alert is None:
+        await raise_unchanged_alert(db, alert_id, "Alert already resolved")
+    await db.commit()
     
     # Publish to Redis
     status_data = {
@@ -459,39 +584,77 @@ def resolve_alert(
         "auv_id": db_alert.auv_id,
         "resolved_by": resolved_by
     }
-    redis_client.publish("alerts:resolved", str(status_data))
+    publisher.publish("alerts:resolved", status_data)
     
     return db_alert
 
 
 # Analytics Endpoints
 @router.get("/analytics/trends")
-def get_alert_trends(
+async def get_alert_trends(
     days: int = Query(30, ge=1, le=365, description="Number of days to analyze"),
     auv_id: Optional[str] = Query(None),
     alert_type: Optional[AlertType] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get alert trends over time"""
-    start_date = datetime.utcnow() - timedelta(days=days)
+    """Get alert trends over time. Alerts backdated into days already rolled up appear after the next
+    rollup refresh (ALERT_ROLLUP_REFRESH_SECONDS)"""
+    now = datetime.now(timezone.utc)
+    start_date = now - timedelta(days=days)
+    
+    # Whole UTC days come from the alert_daily_rollup materialized view, up to the last day it holds
+    # (which may have been partial when it was refreshed); the partial first day and everything
+    # from rollup_end on come from the raw table
+    first_full_day = utc_day(start_date)
+    if first_full_day < start_date:
+        first_full_day += timedelta(days=1)
+    last_rolled_up = await db.scalar(select(func.max(alert_daily_rollup.c.day)))
+    rollup_end = first_full_day
+    if last_rolled_up is not None:
+        rollup_end = max(first_full_day, min(last_rolled_up, utc_day(now)))
+    
+    rollup_query = select(
+        alert_daily_rollup.c.day.label('date'),
+        cast(func.sum(alert_daily_rollup.c.alert_count), Integer).label('count'),
+        alert_daily_rollup.c.severity,
+        alert_daily_rollup.c.alert_type
+    ).where(
+        alert_daily_rollup.c.day >= first_full_day,
+        alert_daily_rollup.c.day < rollup_end
+    )
     
-    query = db.query(
-        func.date_trunc('day', Alert.timestamp).label('date'),
+    # Reuse one expression so SELECT and GROUP BY share the same bound 'day' parameter
+    raw_day = func.date_trunc('day', Alert.timestamp, 'UTC')
+    raw_query = select(
+        raw_day.label('date'),
         func.count(Alert.id).label('count'),
         Alert.severity,
         Alert.alert_type
-    ).filter(Alert.timestamp >= start_date)
+    ).where(
+        Alert.timestamp >= start_date,
+        or_(Alert.timestamp < first_full_day, Alert.timestamp >= rollup_end)
+    )
     
     if auv_id:
-        query = query.filter(Alert.auv_id == auv_id)
+        rollup_query = rollup_query.where(alert_daily_rollup.c.auv_id == auv_id)
+        raw_query = raw_query.where(Alert.auv_id == auv_id)
     if alert_type:
-        query = query.filter(Alert.alert_type == alert_type)
+        rollup_query = rollup_query.where(alert_daily_rollup.c.alert_type == alert_type)
+        raw_query = raw_query.where(Alert.alert_type == alert_type)
     
-    results = query.group_by(
-        func.date_trunc('day', Alert.timestamp),
+    rollup_query = rollup_query.group_by(
+        alert_daily_rollup.c.day,
+        alert_daily_rollup.c.severity,
+        alert_daily_rollup.c.alert_type
+    )
+    raw_query = raw_query.group_by(
+        raw_day,
         Alert.severity,
         Alert.alert_type
-    ).order_by(func.date_trunc('day', Alert.timestamp)).all()
+    )
+    
+    combined = union_all(rollup_query, raw_query).subquery()
+    results = (await db.execute(select(combined).order_by(combined.c.date))).all()
     
     # Format results
     trends = {}
@@ -522,6 +685,6 @@ def get_alert_trends(
     return {
         "period_days": days,
         "start_date": start_date.isoformat(),
-        "end_date": datetime.utcnow().isoformat(),
+        "end_date": now.isoformat(),
         "trends": list(trends.values())
     }
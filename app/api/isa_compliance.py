@@ -1,214 +1,251 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 from typing import List, Optional
+from pydantic import TypeAdapter
 from datetime import datetime, timedelta
-from app.database import get_db
+import asyncio
+from app.database import get_async_db, AsyncSessionLocal
 from app.models.isa_compliance import ISAStandard, ISAZone, ISACompliance, ComplianceStatus, ZoneType
 from app.schemas.isa_compliance import (
     ISAStandardCreate, ISAStandardUpdate, ISAStandardResponse,
     ISAZoneCreate, ISAZoneUpdate, ISAZoneResponse,
     ISAComplianceCreate, ISAComplianceUpdate, ISAComplianceResponse,
-    ComplianceSummary, ComplianceDashboard
+    ComplianceSummary, ComplianceDashboard,
+    ISAStandardResponseListAdapter, ISAZoneResponseListAdapter
 )
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, func, desc, case, select, insert, update, bindparam
+from app.cache import get_cached, set_cached, invalidate, COMPLIANCE_SUMMARY_KEY, STANDARDS_KEY, ZONES_KEY
+from app.config import settings
 
 router = APIRouter(prefix="/isa-compliance", tags=["ISA Compliance"])
 
 
+# Point-lookup statements built once and bound per request, so their compiled form is reused
+STANDARD_BY_ID = select(ISAStandard).where(ISAStandard.id == bindparam("standard_id"))
+ZONE_BY_ID = select(ISAZone).where(ISAZone.id == bindparam("zone_id"))
+COMPLIANCE_BY_ID = select(ISACompliance).where(ISACompliance.id == bindparam("compliance_id"))
+COMPLIANCE_WITH_RELATIONS_BY_ID = select(ISACompliance).options(
+    joinedload(ISACompliance.standard),
+    joinedload(ISACompliance.zone)
+).where(ISACompliance.id == bindparam("compliance_id")).execution_options(populate_existing=True)
+
+
+async def load_compliance_record(db: AsyncSession, compliance_id: int) -> Optional[ISACompliance]:
+    """Load a compliance record with its standard and zone, refreshing any stale identity-map copy"""
+    result = await db.execute(COMPLIANCE_WITH_RELATIONS_BY_ID, {"compliance_id": compliance_id})
+    return result.scalars().first()
+
+
 # ISA Standards Endpoints
 @router.post("/standards/", response_model=ISAStandardResponse)
-def create_isa_standard(
+async def create_isa_standard(
     standard: ISAStandardCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new ISA standard"""
-    db_standard = ISAStandard(**standard.dict())
-    db.add(db_standard)
-    db.commit()
-    db.refresh(db_standard)
+    result = await db.execute(insert(ISAStandard).values(**standard.dict()).returning(ISAStandard))
+    db_standard = result.scalar_one()
+    await db.commit()
+    await invalidate(STANDARDS_KEY, COMPLIANCE_SUMMARY_KEY)
     return db_standard
 
 
 @router.get("/standards/", response_model=List[ISAStandardResponse])
-def get_isa_standards(
+async def get_isa_standards(
     skip: int = Query(0, ge=0, description="Number of records to skip", example=0),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return", example=100),
     category: Optional[str] = Query(None, description="Filter by category", example="environmental"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all ISA standards with optional filtering"""
-    query = db.query(ISAStandard)
+    query = select(ISAStandard)
     
     if category:
-        query = query.filter(ISAStandard.category == category)
+        query = query.where(ISAStandard.category == category)
     
-    standards = query.offset(skip).limit(limit).all()
-    return standards
+    result = await db.execute(query.offset(skip).limit(limit))
+    return result.scalars().all()
 
 
 @router.get("/standards/{standard_id}", response_model=ISAStandardResponse)
-def get_isa_standard(standard_id: int, db: Session = Depends(get_db)):
+async def get_isa_standard(standard_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific ISA standard by ID"""
-    standard = db.query(ISAStandard).filter(ISAStandard.id == standard_id).first()
+    standard = (await db.execute(STANDARD_BY_ID, {"standard_id": standard_id})).scalar_one_or_none()
     if not standard:
         raise HTTPException(status_code=404, detail="ISA Standard not found")
     return standard
 
 
 @router.put("/standards/{standard_id}", response_model=ISAStandardResponse)
-def update_isa_standard(
+async def update_isa_standard(
     standard_id: int,
     standard_update: ISAStandardUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an ISA standard"""
-    db_standard = db.query(ISAStandard).filter(ISAStandard.id == standard_id).first()
+    update_data = standard_update.dict(exclude_unset=True)
+    if update_data:
+        result = await db.execute(
+            update(ISAStandard)
+            .where(ISAStandard.id == standard_id)
+            .values(**update_data)
+            .returning(ISAStandard)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        result = await db.execute(STANDARD_BY_ID, {"standard_id": standard_id})
+    db_standard = result.scalar_one_or_none()
     if not db_standard:
         raise HTTPException(status_code=404, detail="ISA Standard not found")
     
-    update_data = standard_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_standard, field, value)
-    
-    db.commit()
-    db.refresh(db_standard)
+    await db.commit()
+    if update_data:
+        await invalidate(STANDARDS_KEY, COMPLIANCE_SUMMARY_KEY)
     return db_standard
 
 
 @router.delete("/standards/{standard_id}")
-def delete_isa_standard(standard_id: int, db: Session = Depends(get_db)):
+async def delete_isa_standard(standard_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete an ISA standard"""
-    db_standard = db.query(ISAStandard).filter(ISAStandard.id == standard_id).first()
+    db_standard = (await db.execute(STANDARD_BY_ID, {"standard_id": standard_id})).scalar_one_or_none()
     if not db_standard:
         raise HTTPException(status_code=404, detail="ISA Standard not found")
     
-    db.delete(db_standard)
-    db.commit()
+    await db.delete(db_standard)
+    await db.commit()
+    await invalidate(STANDARDS_KEY, COMPLIANCE_SUMMARY_KEY)
     return {"message": "ISA Standard deleted successfully"}
 
 
 # ISA Zones Endpoints
 @router.post("/zones/", response_model=ISAZoneResponse)
-def create_isa_zone(
+async def create_isa_zone(
     zone: ISAZoneCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new ISA zone"""
-    db_zone = ISAZone(**zone.dict())
-    db.add(db_zone)
-    db.commit()
-    db.refresh(db_zone)
+    result = await db.execute(insert(ISAZone).values(**zone.dict()).returning(ISAZone))
+    db_zone = result.scalar_one()
+    await db.commit()
+    await invalidate(ZONES_KEY, COMPLIANCE_SUMMARY_KEY)
     return db_zone
 
 
 @router.get("/zones/", response_model=List[ISAZoneResponse])
-def get_isa_zones(
+async def get_isa_zones(
     skip: int = Query(0, ge=0, description="Number of records to skip", example=0),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return", example=100),
     zone_type: Optional[ZoneType] = Query(None, description="Filter by zone type", example=ZoneType.OPERATIONAL),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all ISA zones with optional filtering"""
-    query = db.query(ISAZone)
+    query = select(ISAZone)
     
     if zone_type:
-        query = query.filter(ISAZone.zone_type == zone_type)
+        query = query.where(ISAZone.zone_type == zone_type)
     
-    zones = query.offset(skip).limit(limit).all()
-    return zones
+    result = await db.execute(query.offset(skip).limit(limit))
+    return result.scalars().all()
 
 
 @router.get("/zones/{zone_id}", response_model=ISAZoneResponse)
-def get_isa_zone(zone_id: int, db: Session = Depends(get_db)):
+async def get_isa_zone(zone_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific ISA zone by ID"""
-    zone = db.query(ISAZone).filter(ISAZone.id == zone_id).first()
+    zone = (await db.execute(ZONE_BY_ID, {"zone_id": zone_id})).scalar_one_or_none()
     if not zone:
         raise HTTPException(status_code=404, detail="ISA Zone not found")
     return zone
 
 
 @router.put("/zones/{zone_id}", response_model=ISAZoneResponse)
-def update_isa_zone(
+async def update_isa_zone(
     zone_id: int,
     zone_update: ISAZoneUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an ISA zone"""
-    db_zone = db.query(ISAZone).filter(ISAZone.id == zone_id).first()
+    update_data = zone_update.dict(exclude_unset=True)
+    if update_data:
+        result = await db.execute(
+            update(ISAZone)
+            .where(ISAZone.id == zone_id)
+            .values(**update_data)
+            .returning(ISAZone)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        result = await db.execute(ZONE_BY_ID, {"zone_id": zone_id})
+    db_zone = result.scalar_one_or_none()
     if not db_zone:
         raise HTTPException(status_code=404, detail="ISA Zone not found")
     
-    update_data = zone_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_zone, field, value)
-    
-    db.commit()
-    db.refresh(db_zone)
+    await db.commit()
+    if update_data:
+        await invalidate(ZONES_KEY, COMPLIANCE_SUMMARY_KEY)
     return db_zone
 
 
 @router.delete("/zones/{zone_id}")
-def delete_isa_zone(zone_id: int, db: Session = Depends(get_db)):
+async def delete_isa_zone(zone_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete an ISA zone"""
-    db_zone = db.query(ISAZone).filter(ISAZone.id == zone_id).first()
+    db_zone = (await db.execute(ZONE_BY_ID, {"zone_id": zone_id})).scalar_one_or_none()
     if not db_zone:
         raise HTTPException(status_code=404, detail="ISA Zone not found")
     
-    db.delete(db_zone)
-    db.commit()
+    await db.delete(db_zone)
+    await db.commit()
+    await invalidate(ZONES_KEY, COMPLIANCE_SUMMARY_KEY)
     return {"message": "ISA Zone deleted successfully"}
 
 
 # ISA Compliance Endpoints
 @router.post("/compliance/", response_model=ISAComplianceResponse)
-def create_isa_compliance(
+async def create_isa_compliance(
     compliance: ISAComplianceCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new ISA compliance record"""
     db_compliance = ISACompliance(**compliance.dict())
     db.add(db_compliance)
-    db.commit()
-    db.refresh(db_compliance)
-    return db_compliance
+    await db.commit()
+    await invalidate(COMPLIANCE_SUMMARY_KEY)
+    return await load_compliance_record(db, db_compliance.id)
 
 
 @router.get("/compliance/", response_model=List[ISAComplianceResponse])
-def get_isa_compliance(
+async def get_isa_compliance(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     auv_id: Optional[str] = Query(None),
     status: Optional[ComplianceStatus] = Query(None),
     standard_id: Optional[int] = Query(None),
     zone_id: Optional[int] = Query(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get ISA compliance records with filtering"""
-    query = db.query(ISACompliance).options(
-        joinedload(ISACompliance.standard),
-        joinedload(ISACompliance.zone)
+    query = select(ISACompliance).options(
+        selectinload(ISACompliance.standard),
+        selectinload(ISACompliance.zone)
     )
     
     if auv_id:
-        query = query.filter(ISACompliance.auv_id == auv_id)
+        query = query.where(ISACompliance.auv_id == auv_id)
     if status:
-        query = query.filter(ISACompliance.status == status)
+        query = query.where(ISACompliance.status == status)
     if standard_id:
-        query = query.filter(ISACompliance.standard_id == standard_id)
+        query = query.where(ISACompliance.standard_id == standard_id)
     if zone_id:
-        query = query.filter(ISACompliance.zone_id == zone_id)
+        query = query.where(ISACompliance.zone_id == zone_id)
     
-    compliance_records = query.offset(skip).limit(limit).all()
-    return compliance_records
+    result = await db.execute(query.offset(skip).limit(limit))
+    return result.scalars().all()
 
 
 @router.get("/compliance/{compliance_id}", response_model=ISAComplianceResponse)
-def get_isa_compliance_record(compliance_id: int, db: Session = Depends(get_db)):
+async def get_isa_compliance_record(compliance_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific ISA compliance record by ID"""
-    compliance = db.query(ISACompliance).options(
-        joinedload(ISACompliance.standard),
-        joinedload(ISACompliance.zone)
-    ).filter(ISACompliance.id == compliance_id).first()
+    compliance = await load_compliance_record(db, compliance_id)
     
     if not compliance:
         raise HTTPException(status_code=404, detail="ISA Compliance record not found")
@@ -216,13 +253,13 @@ def get_isa_compliance_record(compliance_id: int, db: Session = Depends(get_db))
 
 
 @router.put("/compliance/{compliance_id}", response_model=ISAComplianceResponse)
-def update_isa_compliance(
+async def update_isa_compliance(
     compliance_id: int,
     compliance_update: ISAComplianceUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Update an ISA compliance record"""
-    db_compliance = db.query(ISACompliance).filter(ISACompliance.id == compliance_id).first()
+    db_compliance = (await db.execute(COMPLIANCE_BY_ID, {"compliance_id": compliance_id})).scalar_one_or_none()
     if not db_compliance:
         raise HTTPException(status_code=404, detail="ISA Compliance record not found")
     
@@ -230,90 +267,90 @@ def update_isa_compliance(
     for field, value in update_data.items():
         setattr(db_compliance, field, value)
     
-    db.commit()
-    db.refresh(db_compliance)
-    return db_compliance
+    await db.commit()
+    await invalidate(COMPLIANCE_SUMMARY_KEY)
+    return await load_compliance_record(db, compliance_id)
 
 
 @router.delete("/compliance/{compliance_id}")
-def delete_isa_compliance(compliance_id: int, db: Session = Depends(get_db)):
+async def delete_isa_compliance(compliance_id: int, db: AsyncSession = Depends(get_async_db)):
     """Delete an ISA compliance record"""
-    db_compliance = db.query(ISACompliance).filter(ISACompliance.id == compliance_id).first()
+    db_compliance = (await db.execute(COMPLIANCE_BY_ID, {"compliance_id": compliance_id})).scalar_one_or_none()
     if not db_compliance:
         raise HTTPException(status_code=404, detail="ISA Compliance record not found")
     
-    db.delete(db_compliance)
-    db.commit()
+    await db.delete(db_compliance)
+    await db.commit()
+    await invalidate(COMPLIANCE_SUMMARY_KEY)
     return {"message": "ISA Compliance record deleted successfully"}
 
 
 # Dashboard and Summary Endpoints
 @router.get("/dashboard/summary", response_model=ComplianceSummary)
-def get_compliance_summary(db: Session = Depends(get_db)):
+async def get_compliance_summary(db: AsyncSession = Depends(get_async_db)):
     """Get compliance summary statistics"""
-    # Get total AUV count (unique AUVs)
-    total_auv_count = db.query(func.count(func.distinct(ISACompliance.auv_id))).scalar()
-    
-    # Get compliance counts
-    compliant_count = db.query(func.count(ISACompliance.id)).filter(
-        ISACompliance.status == ComplianceStatus.COMPLIANT
-    ).scalar()
+    cached = await get_cached(COMPLIANCE_SUMMARY_KEY)
+    if cached is not None:
+        return ComplianceSummary(**cached)
     
-    non_compliant_count = db.query(func.count(ISACompliance.id)).filter(
-        ISACompliance.status == ComplianceStatus.NON_COMPLIANT
-    ).scalar()
-    
-    pending_count = db.query(func.count(ISACompliance.id)).filter(
-        ISACompliance.status == ComplianceStatus.PENDING
-    ).scalar()
+    # One round-trip: conditional aggregates over compliance records plus
+    # scalar subqueries for the standards and zones counts
+    result = await db.execute(select(
+        func.count(ISACompliance.id).label('total_records'),
+        func.count(func.distinct(ISACompliance.auv_id)).label('total_auv_count'),
+        func.count(case((ISACompliance.status == ComplianceStatus.COMPLIANT, 1))).label('compliant_count'),
+        func.count(case((ISACompliance.status == ComplianceStatus.NON_COMPLIANT, 1))).label('non_compliant_count'),
+        func.count(case((ISACompliance.status == ComplianceStatus.PENDING, 1))).label('pending_count'),
+        func.count(case((ISACompliance.violations_count > 0, 1))).label('active_violations_count'),
+        select(func.count(ISAStandard.id)).scalar_subquery().label('standards_count'),
+        select(func.count(ISAZone.id)).scalar_subquery().label('zones_count')
+    ))
+    row = result.one()
     
     # Calculate overall compliance rate
-    total_records = db.query(func.count(ISACompliance.id)).scalar()
-    overall_compliance_rate = (compliant_count / total_records * 100) if total_records > 0 else 0
-    
-    # Get counts for other entities
-    standards_count = db.query(func.count(ISAStandard.id)).scalar()
-    zones_count = db.query(func.count(ISAZone.id)).scalar()
-    active_violations_count = db.query(func.count(ISACompliance.id)).filter(
-        ISACompliance.violations_count > 0
-    ).scalar()
+    overall_compliance_rate = (row.compliant_count / row.total_records * 100) if row.total_records > 0 else 0
     
-    return ComplianceSummary(
-        total_auv_count=total_auv_count,
-        compliant_auv_count=compliant_count,
-        non_compliant_auv_count=non_compliant_count,
-        pending_assessment_count=pending_count,
+    summary = ComplianceSummary(
+        total_auv_count=row.total_auv_count,
+        compliant_auv_count=row.compliant_count,
+        non_compliant_auv_count=row.non_compliant_count,
+        pending_assessment_count=row.pending_count,
         overall_compliance_rate=overall_compliance_rate,
-        standards_count=standards_count,
-        zones_count=zones_count,
-        active_violations_count=active_violations_count
+        standards_count=row.standards_count,
+        zones_count=row.zones_count,
+        active_violations_count=row.active_violations_count
     )
+    await set_cached(COMPLIANCE_SUMMARY_KEY, summary.dict(), settings.ISA_SUMMARY_CACHE_SECONDS)
+    return summary
 
 
 @router.get("/dashboard/", response_model=ComplianceDashboard)
-def get_compliance_dashboard(db: Session = Depends(get_db)):
+async def get_compliance_dashboard(db: AsyncSession = Depends(get_async_db)):
     """Get comprehensive compliance dashboard data"""
-    # Get summary
-    summary = get_compliance_summary(db)
-    
     # Get recent compliance records
-    recent_compliance = db.query(ISACompliance).options(
-        joinedload(ISACompliance.standard),
-        joinedload(ISACompliance.zone)
-    ).order_by(desc(ISACompliance.updated_at)).limit(10).all()
+    recent_stmt = select(ISACompliance).options(
+        selectinload(ISACompliance.standard),
+        selectinload(ISACompliance.zone)
+    ).order_by(desc(ISACompliance.updated_at)).limit(10)
     
     # Get upcoming assessments (next 7 days)
     next_week = datetime.utcnow() + timedelta(days=7)
-    upcoming_assessments = db.query(ISACompliance).options(
-        joinedload(ISACompliance.standard),
-        joinedload(ISACompliance.zone)
-    ).filter(
+    upcoming_stmt = select(ISACompliance).options(
+        selectinload(ISACompliance.standard),
+        selectinload(ISACompliance.zone)
+    ).where(
         ISACompliance.next_assessment <= next_week
-    ).order_by(ISACompliance.next_assessment).limit(10).all()
+    ).order_by(ISACompliance.next_assessment).limit(10)
     
-    # Get all standards and zones
-    standards = db.query(ISAStandard).all()
-    zones = db.query(ISAZone).all()
+    # Run the sub-queries concurrently; the summary uses the request session and
+    # every other query gets its own, since an AsyncSession is not concurrency-safe
+    summary, recent_compliance, upcoming_assessments, standards, zones = await asyncio.gather(
+        get_compliance_summary(db),
+        fetch_all(recent_stmt),
+        fetch_all(upcoming_stmt),
+        get_cached_listing(STANDARDS_KEY, ISAStandard, ISAStandardResponseListAdapter),
+        get_cached_listing(ZONES_KEY, ISAZone, ISAZoneResponseListAdapter)
+    )
     
     return ComplianceDashboard(
         summary=summary,
@@ -324,42 +361,58 @@ def get_compliance_dashboard(db: Session = Depends(get_db)):
     )
 
 
+async def fetch_all(stmt) -> list:
+    """Execute stmt in a dedicated session and return all ORM results"""
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
+
+async def get_cached_listing(key: str, model, adapter: TypeAdapter) -> list:
+    """Return every row of model as serialized schema dicts, cached since they rarely change"""
+    listing = await get_cached(key)
+    if listing is None:
+        listing = adapter.dump_python(adapter.validate_python(await fetch_all(select(model)), from_attributes=True))
+        await set_cached(key, listing, settings.ISA_REFERENCE_CACHE_SECONDS)
+    return listing
+
+
 # AUV-specific compliance endpoints
 @router.get("/auv/{auv_id}/compliance", response_model=List[ISAComplianceResponse])
-def get_auv_compliance(
+async def get_auv_compliance(
     auv_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get all compliance records for a specific AUV"""
-    compliance_records = db.query(ISACompliance).options(
-        joinedload(ISACompliance.standard),
-        joinedload(ISACompliance.zone)
-    ).filter(ISACompliance.auv_id == auv_id).all()
+    result = await db.execute(select(ISACompliance).options(
+        selectinload(ISACompliance.standard),
+        selectinload(ISACompliance.zone)
+    ).where(ISACompliance.auv_id == auv_id))
     
-    return compliance_records
+    return result.scalars().all()
 
 
 @router.get("/auv/{auv_id}/compliance/summary")
-def get_auv_compliance_summary(auv_id: str, db: Session = Depends(get_db)):
+async def get_auv_compliance_summary(auv_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get compliance summary for a specific AUV"""
-    total_records = db.query(func.count(ISACompliance.id)).filter(
+    total_records = await db.scalar(select(func.count(ISACompliance.id)).where(
         ISACompliance.auv_id == auv_id
-    ).scalar()
+    ))
     
-    compliant_records = db.query(func.count(ISACompliance.id)).filter(
+    compliant_records = await db.scalar(select(func.count(ISACompliance.id)).where(
         and_(
             ISACompliance.auv_id == auv_id,
             ISACompliance.status == ComplianceStatus.COMPLIANT
         )
-    ).scalar()
+    ))
     
-    avg_score = db.query(func.avg(ISACompliance.compliance_score)).filter(
+    avg_score = await db.scalar(select(func.avg(ISACompliance.compliance_score)).where(
         ISACompliance.auv_id == auv_id
-    ).scalar() or 0
+    )) or 0
     
-    total_violations = db.query(func.sum(ISACompliance.violations_count)).filter(
+    total_violations = await db.scalar(select(func.sum(ISACompliance.violations_count)).where(
         ISACompliance.auv_id == auv_id
-    ).scalar() or 0
+    )) or 0
     
     return {
         "auv_id": auv_id,
@@ -1,77 +1,179 @@
 from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
-from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Dict, Any, Tuple
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime, timedelta, timezone
-import json
 import asyncio
-from app.database import get_db
-from app.models.telemetry import AUVData, TelemetryData
+from app.database import get_async_db
+from app.models.telemetry import (
+    AUVData, TelemetryData,
+    auv_data_hourly_rollup, telemetry_data_hourly_rollup,
+    AUV_DATA_ROLLUP_METRICS, TELEMETRY_DATA_ROLLUP_METRICS
+)
 from app.schemas.telemetry import (
     AUVDataCreate, AUVDataResponse,
     TelemetryDataCreate, TelemetryDataResponse,
     RealTimeTelemetry, TelemetryQueryParams, TelemetryAggregationParams, TelemetryAggregationResponse
 )
-from sqlalchemy import and_, func, desc
-import redis
+from sqlalchemy import and_, or_, func, desc, select, union_all, cast, bindparam, BigInteger, Float, Integer
+from app.redis_batcher import publisher
+from app.insert_batcher import auv_data_batcher, telemetry_data_batcher
+from app.pubsub_hub import telemetry_hub
+from app.cache import cache_latest, get_latest, latest_telemetry_key
 from app.config import settings
+from app.streaming import stream_json_array, stream_ndjson
 
 router = APIRouter(prefix="/telemetry", tags=["Telemetry"])
 
-# Redis connection for real-time data
-redis_client = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
+# Plain column rows for latest-row lookups; read without ORM hydration
+AUV_DATA_COLUMNS = tuple(AUVData.__table__.columns)
+TELEMETRY_DATA_COLUMNS = tuple(TelemetryData.__table__.columns)
+
+
+# Largest list accepted by the batch ingest endpoints (one multi-row INSERT each)
+MAX_INGEST_BATCH_SIZE = 1000
+
+# WebSocket frames carry up to this many messages collected over the batch window
+WS_BATCH_SIZE = 64
+WS_BATCH_WINDOW_SECONDS = 0.01
+# A subscriber that fell this many messages behind between two frames is disconnected (close code 1013, try again later)
+WS_MAX_DROPPED_MESSAGES = 1000
+
+
+# Fields of the latest-row dicts cached and served by /latest and /status, read in one attrgetter call
+AUV_LATEST_FIELDS = (
+    "id", "auv_id", "timestamp", "latitude", "longitude", "depth", "altitude", "heading", "speed",
+    "battery_level", "temperature", "pressure", "system_status", "mission_id", "mission_phase", "telemetry_data"
+)
+ENV_LATEST_FIELDS = (
+    "id", "auv_id", "timestamp", "water_temperature", "salinity", "ph_level", "dissolved_oxygen", "turbidity",
+    "current_speed", "current_direction", "sensor_data", "data_quality_score", "sensor_status"
+)
+get_auv_latest_fields = attrgetter(*AUV_LATEST_FIELDS)
+get_env_latest_fields = attrgetter(*ENV_LATEST_FIELDS)
+
+
+def auv_data_dict(row) -> Dict[str, Any]:
+    """JSON-ready fields of an AUV data row (ORM instance or column row), as cached and served by /latest and /status"""
+    data = dict(zip(AUV_LATEST_FIELDS, get_auv_latest_fields(row)))
+    data["timestamp"] = data["timestamp"].isoformat()
+    return data
+
+
+def env_data_dict(row) -> Dict[str, Any]:
+    """JSON-ready fields of an environmental data row (ORM instance or column row), as cached and served by /latest"""
+    data = dict(zip(ENV_LATEST_FIELDS, get_env_latest_fields(row)))
+    data["timestamp"] = data["timestamp"].isoformat()
+    return data
 
 
 # Real-time Telemetry Endpoints
 @router.post("/realtime/auv-data", response_model=AUVDataResponse)
-def create_auv_data(
-    auv_data: AUVDataCreate,
-    db: Session = Depends(get_db)
+async def create_auv_data(
+    auv_data: AUVDataCreate
 ):
     """Ingest real-time AUV telemetry data"""
-    db_auv_data = AUVData(**auv_data.dict())
-    db.add(db_auv_data)
-    db.commit()
-    db.refresh(db_auv_data)
-    
-    # Publish to Redis for real-time subscribers
-    # Convert datetime to ISO format for JSON serialization
+    # Coalesced with concurrent ingests into one multi-row INSERT ... RETURNING
     data_dict = auv_data.dict()
-    data_dict['timestamp'] = auv_data.timestamp.isoformat()
+    db_auv_data = await auv_data_batcher.submit(data_dict)
+    cache_latest(latest_telemetry_key("auv", db_auv_data.auv_id), db_auv_data.timestamp, auv_data_dict(db_auv_data), settings.TELEMETRY_LATEST_CACHE_SECONDS)
     
+    # Queue for real-time subscribers; published in pipelined batches off the request path.
+    # The publisher encodes with orjson, which serializes the datetimes natively
     realtime_data = {
         "type": "auv_data",
         "auv_id": auv_data.auv_id,
-        "timestamp": auv_data.timestamp.isoformat(),
+        "timestamp": auv_data.timestamp,
         "data": data_dict
     }
-    redis_client.publish(f"telemetry:auv:{auv_data.auv_id}", json.dumps(realtime_data))
+    publisher.publish(f"telemetry:auv:{auv_data.auv_id}", realtime_data)
     
     return db_auv_data
 
 
 @router.post("/realtime/environmental", response_model=TelemetryDataResponse)
-def create_environmental_data(
-    env_data: TelemetryDataCreate,
-    db: Session = Depends(get_db)
+async def create_environmental_data(
+    env_data: TelemetryDataCreate
 ):
     """Ingest real-time environmental telemetry data"""
-    db_env_data = TelemetryData(**env_data.dict())
-    db.add(db_env_data)
-    db.commit()
-    db.refresh(db_env_data)
-    
-    # Publish to Redis for real-time subscribers
-    # Convert datetime to ISO format for JSON serialization
+    # Coalesced with concurrent ingests into one multi-row INSERT ... RETURNING
     data_dict = env_data.dict()
-    data_dict['timestamp'] = env_data.timestamp.isoformat()
+    db_env_data = await telemetry_data_batcher.submit(data_dict)
+    cache_latest(latest_telemetry_key("environmental", db_env_data.auv_id), db_env_data.timestamp, env_data_dict(db_env_data), settings.TELEMETRY_LATEST_CACHE_SECONDS)
     
+    # Queue for real-time subscribers; published in pipelined batches off the request path.
+    # The publisher encodes with orjson, which serializes the datetimes natively
     realtime_data = {
         "type": "environmental",
         "auv_id": env_data.auv_id,
-        "timestamp": env_data.timestamp.isoformat(),
+        "timestamp": env_data.timestamp,
         "data": data_dict
     }
-    redis_client.publish(f"telemetry:environmental:{env_data.auv_id}", json.dumps(realtime_data))
+    publisher.publish(f"telemetry:environmental:{env_data.auv_id}", realtime_data)
+    
+    return db_env_data
+
+
+@router.post("/realtime/auv-data/batch", response_model=List[AUVDataResponse])
+async def create_auv_data_batch(
+    auv_data: List[AUVDataCreate]
+):
+    """Ingest a batch of AUV telemetry samples in one INSERT"""
+    if len(auv_data) > MAX_INGEST_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_INGEST_BATCH_SIZE} samples per batch")
+    if not auv_data:
+        return []
+    data_dicts = [sample.dict() for sample in auv_data]
+    db_auv_data = await auv_data_batcher.insert_many(data_dicts)
+    
+    # Only the newest sample per AUV can become the cached latest row
+    newest = {}
+    for row in db_auv_data:
+        if row.auv_id not in newest or row.timestamp > newest[row.auv_id].timestamp:
+            newest[row.auv_id] = row
+    for auv_id, row in newest.items():
+        cache_latest(latest_telemetry_key("auv", auv_id), row.timestamp, auv_data_dict(row), settings.TELEMETRY_LATEST_CACHE_SECONDS)
+    
+    for sample, data_dict in zip(auv_data, data_dicts):
+        publisher.publish(f"telemetry:auv:{sample.auv_id}", {
+            "type": "auv_data",
+            "auv_id": sample.auv_id,
+            "timestamp": sample.timestamp,
+            "data": data_dict
+        })
+    
+    return db_auv_data
+
+
+@router.post("/realtime/environmental/batch", response_model=List[TelemetryDataResponse])
+async def create_environmental_data_batch(
+    env_data: List[TelemetryDataCreate]
+):
+    """Ingest a batch of environmental telemetry samples in one INSERT"""
+    if len(env_data) > MAX_INGEST_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_INGEST_BATCH_SIZE} samples per batch")
+    if not env_data:
+        return []
+    data_dicts = [sample.dict() for sample in env_data]
+    db_env_data = await telemetry_data_batcher.insert_many(data_dicts)
+    
+    # Only the newest sample per AUV can become the cached latest row
+    newest = {}
+    for row in db_env_data:
+        if row.auv_id not in newest or row.timestamp > newest[row.auv_id].timestamp:
+            newest[row.auv_id] = row
+    for auv_id, row in newest.items():
+        cache_latest(latest_telemetry_key("environmental", auv_id), row.timestamp, env_data_dict(row), settings.TELEMETRY_LATEST_CACHE_SECONDS)
+    
+    for sample, data_dict in zip(env_data, data_dicts):
+        publisher.publish(f"telemetry:environmental:{sample.auv_id}", {
+            "type": "environmental",
+            "auv_id": sample.auv_id,
+            "timestamp": sample.timestamp,
+            "data": data_dict
+        })
     
     return db_env_data
 
@@ -82,342 +184,359 @@ async def websocket_endpoint(websocket: WebSocket, auv_id: str):
     """WebSocket endpoint for real-time telemetry subscription"""
     await websocket.accept()
     
-    # Subscribe to Redis channels for this AUV
-    pubsub = redis_client.pubsub()
-    await pubsub.subscribe(f"telemetry:auv:{auv_id}", f"telemetry:environmental:{auv_id}")
+    # Messages arrive through the process-wide Redis subscription, not one per socket
+    queue = telemetry_hub.add(auv_id)
     
-    try:
+    async def forward_messages():
         while True:
-            # Check for messages from Redis
-            message = await pubsub.get_message(timeout=1)
-            if message and message['type'] == 'message':
-                await websocket.send_text(message['data'])
-            
-            # Check for client messages (subscription control)
-            try:
-                data = await asyncio.wait_for(websocket.receive_text(), timeout=0.1)
-                # Handle subscription control messages if needed
-                pass
-            except asyncio.TimeoutError:
-                pass
+            # Coalesce messages arriving within a short window into one JSON-array frame;
+            # payloads are already JSON so they are joined without re-parsing.
+            # One sleep per frame instead of a timed get per message keeps idle and busy sockets cheap
+            batch = [await queue.get()]
+            if queue.qsize() < WS_BATCH_SIZE - 1:
+                await asyncio.sleep(WS_BATCH_WINDOW_SECONDS)
+            while len(batch) < WS_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
             
+            # Messages the hub discarded while this socket lagged are reported ahead of the batch
+            dropped = telemetry_hub.take_dropped(queue)
+            if dropped > WS_MAX_DROPPED_MESSAGES:
+                await websocket.close(code=1013)
+                return
+            if dropped:
+                batch.insert(0, f'{{"type":"lag","dropped":{dropped}}}')
+            await websocket.send_text("[" + ",".join(batch) + "]")
+    
+    async def receive_client_messages():
+        # Subscription control messages are not handled yet; reading detects disconnects
+        while True:
+            await websocket.receive_text()
+    
+    tasks = [asyncio.create_task(forward_messages()), asyncio.create_task(receive_client_messages())]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            if not isinstance(task.exception(), WebSocketDisconnect):
+                task.result()
     except WebSocketDisconnect:
-        await pubsub.unsubscribe(f"telemetry:auv:{auv_id}", f"telemetry:environmental:{auv_id}")
-        await pubsub.close()
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Let the cancelled side unwind before the socket is torn down
+        await asyncio.gather(*tasks, return_exceptions=True)
+        telemetry_hub.remove(auv_id, queue)
 
 
 # Historical Data Endpoints
+def parse_time_param(name: str, value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name} format. Use ISO format: YYYY-MM-DDTHH:MM:SS")
+
+
+def historical_params(auv_id: Optional[str], start_time: Optional[str], end_time: Optional[str], limit: int, offset: int) -> Dict[str, Any]:
+    """Bind values for historical_query; filters that were not supplied are left out"""
+    values = {'limit': limit, 'offset': offset}
+    if auv_id:
+        values['auv_id'] = auv_id
+    if start_time:
+        values['start_time'] = parse_time_param('start_time', start_time)
+    if end_time:
+        values['end_time'] = parse_time_param('end_time', end_time)
+    return values
+
+
+# Response encoders for the historical listings' format parameter
+HISTORICAL_FORMATS = {
+    "json": stream_json_array,
+    "ndjson": stream_ndjson,
+}
+
+
+@lru_cache(maxsize=None)
+def historical_query(model, by_auv: bool, from_start: bool, to_end: bool):
+    """Newest-first listing of a telemetry table, built once per filter combination and bound per request"""
+    query = select(*model.__table__.columns)
+    if by_auv:
+        query = query.where(model.auv_id == bindparam('auv_id'))
+    if from_start:
+        query = query.where(model.timestamp >= bindparam('start_time'))
+    if to_end:
+        query = query.where(model.timestamp <= bindparam('end_time'))
+    return query.order_by(desc(model.timestamp)).offset(bindparam('offset', type_=Integer)).limit(bindparam('limit', type_=Integer))
+
+
 @router.get("/historical/auv-data", response_model=List[AUVDataResponse])
-def get_auv_historical_data(
+async def get_auv_historical_data(
     auv_id: Optional[str] = Query(None, description="Filter by AUV ID", example="AUV-001"),
     start_time: Optional[str] = Query(None, description="Start time for query (ISO format: YYYY-MM-DDTHH:MM:SS)", example="2025-08-10T00:00:00"),
     end_time: Optional[str] = Query(None, description="End time for query (ISO format: YYYY-MM-DDTHH:MM:SS)", example="2025-08-15T23:59:59"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return", example=100),
     offset: int = Query(0, ge=0, description="Number of records to skip", example=0),
-    db: Session = Depends(get_db)
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json for one array, ndjson for one record per line", example="json")
 ):
     """Get historical AUV telemetry data with filtering and pagination"""
-    query = db.query(AUVData)
-    
-    if auv_id:
-        query = query.filter(AUVData.auv_id == auv_id)
-    if start_time:
-        try:
-            start_datetime = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-            query = query.filter(AUVData.timestamp >= start_datetime)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid start_time format. Use ISO format: YYYY-MM-DDTHH:MM:SS")
-    if end_time:
-        try:
-            end_datetime = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-            query = query.filter(AUVData.timestamp <= end_datetime)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid end_time format. Use ISO format: YYYY-MM-DDTHH:MM:SS")
-    
-    auv_data = query.order_by(desc(AUVData.timestamp)).offset(offset).limit(limit).all()
-    return auv_data
+    values = historical_params(auv_id, start_time, end_time, limit, offset)
+    query = historical_query(AUVData, 'auv_id' in values, 'start_time' in values, 'end_time' in values)
+    return HISTORICAL_FORMATS[format](query, params=values)
 
 
 @router.get("/historical/environmental", response_model=List[TelemetryDataResponse])
-def get_environmental_historical_data(
+async def get_environmental_historical_data(
     auv_id: Optional[str] = Query(None, description="Filter by AUV ID", example="AUV-001"),
     start_time: Optional[str] = Query(None, description="Start time for query (ISO format: YYYY-MM-DDTHH:MM:SS)", example="2025-08-10T00:00:00"),
     end_time: Optional[str] = Query(None, description="End time for query (ISO format: YYYY-MM-DDTHH:MM:SS)", example="2025-08-15T23:59:59"),
     limit: int = Query(100, ge=1, le=1000, description="Number of records to return", example=100),
     offset: int = Query(0, ge=0, description="Number of records to skip", example=0),
-    db: Session = Depends(get_db)
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json for one array, ndjson for one record per line", example="json")
 ):
     """Get historical environmental telemetry data with filtering and pagination"""
-    query = db.query(TelemetryData)
-    
-    if auv_id:
-        query = query.filter(TelemetryData.auv_id == auv_id)
-    if start_time:
-        try:
-            start_datetime = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-            query = query.filter(TelemetryData.timestamp >= start_datetime)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid start_time format. Use ISO format: YYYY-MM-DDTHH:MM:SS")
-    if end_time:
-        try:
-            end_datetime = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
-            query = query.filter(TelemetryData.timestamp <= end_datetime)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid end_time format. Use ISO format: YYYY-MM-DDTHH:MM:SS")
-    
-    env_data = query.order_by(desc(TelemetryData.timestamp)).offset(offset).limit(limit).all()
-    return env_data
+    values = historical_params(auv_id, start_time, end_time, limit, offset)
+    query = historical_query(TelemetryData, 'auv_id' in values, 'start_time' in values, 'end_time' in values)
+    return HISTORICAL_FORMATS[format](query, params=values)
 
 
 # Aggregation Endpoints
-@router.post("/aggregation/auv-data", response_model=List[TelemetryAggregationResponse])
-def get_auv_data_aggregation(
-    params: TelemetryAggregationParams,
-    db: Session = Depends(get_db)
-):
-    """Get aggregated AUV telemetry data"""
-    query = db.query(AUVData)
-    
-    if params.auv_id:
-        query = query.filter(AUVData.auv_id == params.auv_id)
-    
-    query = query.filter(
+# Bucket widths per interval; unknown intervals fall back to hourly buckets
+AGGREGATION_INTERVALS = {
+    "1m": timedelta(minutes=1),
+    "5m": timedelta(minutes=5),
+    "15m": timedelta(minutes=15),
+    "1h": timedelta(hours=1),
+    "1d": timedelta(days=1),
+}
+# Origin that date_bin aligns buckets to (UTC midnight, so buckets fall on whole minutes/hours/days)
+BUCKET_ORIGIN = datetime(2000, 1, 1, tzinfo=timezone.utc)
+# Per-metric aggregates, in the order both aggregation queries select them
+AGGREGATE_KEYS = ('min', 'max', 'avg', 'count')
+# Bucket width of the hourly rollup tables and the rollup backing each telemetry table
+ROLLUP_BUCKET = timedelta(hours=1)
+HOURLY_ROLLUPS = {
+    AUVData: (auv_data_hourly_rollup, AUV_DATA_ROLLUP_METRICS),
+    TelemetryData: (telemetry_data_hourly_rollup, TELEMETRY_DATA_ROLLUP_METRICS),
+}
+# Numeric columns each table can aggregate, resolved once at import
+AGGREGATABLE_METRICS = {
+    model: frozenset(
+        column.key for column in model.__table__.columns
+        if isinstance(column.type, (Float, Integer)) and not column.primary_key
+    )
+    for model in (AUVData, TelemetryData)
+}
+# Distinct aggregation statements kept built, keyed by model, metric tuple, bucket width and AUV filter
+AGGREGATION_STATEMENT_CACHE_SIZE = 128
+
+
+def as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC and normalize aware ones to UTC"""
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def floor_hour(value: datetime) -> datetime:
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+@lru_cache(maxsize=AGGREGATION_STATEMENT_CACHE_SIZE)
+def raw_aggregation_query(model, metrics: Tuple[str, ...], bucket_width: timedelta, by_auv: bool):
+    """Aggregate the raw table with date_bin buckets; bound by start_time, end_time and (if by_auv) auv_id"""
+    time_group = func.date_bin(bucket_width, model.timestamp, BUCKET_ORIGIN)
+    
+    select_fields = [time_group.label('interval_start'), model.auv_id]
+    for metric in metrics:
+        column = getattr(model, metric)
+        select_fields.extend([
+            func.min(column).label(f'{metric}_min'),
+            func.max(column).label(f'{metric}_max'),
+            func.avg(column).label(f'{metric}_avg'),
+            func.count(column).label(f'{metric}_count')
+        ])
+    
+    query = select(*select_fields).where(
         and_(
-            AUVData.timestamp >= params.start_time,
-            AUVData.timestamp <= params.end_time
+            model.timestamp >= bindparam('start_time'),
+            model.timestamp <= bindparam('end_time')
         )
     )
-    
-    # Group by time intervals
-    if params.interval == "1m":
-        time_group = func.date_trunc('minute', AUVData.timestamp)
-    elif params.interval == "5m":
-        time_group = func.date_trunc('minute', AUVData.timestamp - timedelta(minutes=AUVData.timestamp.minute % 5))
-    elif params.interval == "15m":
-        time_group = func.date_trunc('minute', AUVData.timestamp - timedelta(minutes=AUVData.timestamp.minute % 15))
-    elif params.interval == "1h":
-        time_group = func.date_trunc('hour', AUVData.timestamp)
-    elif params.interval == "1d":
-        time_group = func.date_trunc('day', AUVData.timestamp)
-    else:
-        time_group = func.date_trunc('hour', AUVData.timestamp)
-    
-    # Build aggregation query
-    select_fields = [time_group.label('interval_start')]
-    select_fields.append(AUVData.auv_id)
-    
-    for metric in params.metrics:
-        if hasattr(AUVData, metric):
-            select_fields.extend([
-                func.min(getattr(AUVData, metric)).label(f'{metric}_min'),
-                func.max(getattr(AUVData, metric)).label(f'{metric}_max'),
-                func.avg(getattr(AUVData, metric)).label(f'{metric}_avg'),
-                func.count(getattr(AUVData, metric)).label(f'{metric}_count')
-            ])
-    
-    query = query.with_entities(*select_fields).group_by(time_group, AUVData.auv_id)
-    
-    results = query.all()
-    
-    # Format results
-    formatted_results = []
-    for result in results:
-        metrics = {}
-        for metric in params.metrics:
-            if hasattr(AUVData, metric):
-                metrics[metric] = {
-                    'min': getattr(result, f'{metric}_min'),
-                    'max': getattr(result, f'{metric}_max'),
-                    'avg': getattr(result, f'{metric}_avg'),
-                    'count': getattr(result, f'{metric}_count')
-                }
-        
-        # Calculate interval_end based on interval type
-        interval_start = result.interval_start
-        if params.interval == "1m":
-            interval_end = interval_start + timedelta(minutes=1)
-        elif params.interval == "5m":
-            interval_end = interval_start + timedelta(minutes=5)
-        elif params.interval == "15m":
-            interval_end = interval_start + timedelta(minutes=15)
-        elif params.interval == "1h":
-            interval_end = interval_start + timedelta(hours=1)
-        elif params.interval == "1d":
-            interval_end = interval_start + timedelta(days=1)
-        else:
-            interval_end = interval_start + timedelta(hours=1)
-        
-        formatted_results.append(TelemetryAggregationResponse(
-            interval_start=interval_start,
-            interval_end=interval_end,
-            auv_id=result.auv_id,
-            metrics=metrics
-        ))
-    
-    return formatted_results
+    if by_auv:
+        query = query.where(model.auv_id == bindparam('auv_id'))
+    return query.group_by(time_group, model.auv_id).order_by(time_group, model.auv_id)
 
 
-@router.post("/aggregation/environmental", response_model=List[TelemetryAggregationResponse])
-def get_environmental_aggregation(
-    params: TelemetryAggregationParams,
-    db: Session = Depends(get_db)
-):
-    """Get aggregated environmental telemetry data"""
-    query = db.query(TelemetryData)
-    
-    if params.auv_id:
-        query = query.filter(TelemetryData.auv_id == params.auv_id)
+@lru_cache(maxsize=AGGREGATION_STATEMENT_CACHE_SIZE)
+def rollup_aggregation_query(model, rollup, metrics: Tuple[str, ...], bucket_width: timedelta, by_auv: bool):
+    """Aggregate whole hours from the hourly rollup table and only the edges from the raw table;
+    bound by start_time, end_time, first_full_hour, rollup_end and (if by_auv) auv_id"""
+    rollup_part = select(
+        rollup.c.bucket,
+        rollup.c.auv_id,
+        *[rollup.c[f'{metric}_{part}'] for metric in metrics for part in ('min', 'max', 'sum', 'count')]
+    ).where(
+        rollup.c.bucket >= bindparam('first_full_hour'),
+        rollup.c.bucket < bindparam('rollup_end')
+    )
     
-    query = query.filter(
-        and_(
-            TelemetryData.timestamp >= params.start_time,
-            TelemetryData.timestamp <= params.end_time
-        )
+    raw_hour = func.date_bin(ROLLUP_BUCKET, model.timestamp, BUCKET_ORIGIN)
+    raw_fields = [raw_hour.label('bucket'), model.auv_id]
+    for metric in metrics:
+        column = getattr(model, metric)
+        raw_fields.extend([
+            func.min(column).label(f'{metric}_min'),
+            func.max(column).label(f'{metric}_max'),
+            func.sum(column).label(f'{metric}_sum'),
+            func.count(column).label(f'{metric}_count')
+        ])
+    raw_part = select(*raw_fields).where(
+        model.timestamp >= bindparam('start_time'),
+        model.timestamp <= bindparam('end_time'),
+        or_(model.timestamp < bindparam('first_full_hour'), model.timestamp >= bindparam('rollup_end'))
     )
     
-    # Group by time intervals
-    if params.interval == "1m":
-        time_group = func.date_trunc('minute', TelemetryData.timestamp)
-    elif params.interval == "5m":
-        time_group = func.date_trunc('minute', TelemetryData.timestamp - timedelta(minutes=TelemetryData.timestamp.minute % 5))
-    elif params.interval == "15m":
-        time_group = func.date_trunc('minute', TelemetryData.timestamp - timedelta(minutes=TelemetryData.timestamp.minute % 15))
-    elif params.interval == "1h":
-        time_group = func.date_trunc('hour', TelemetryData.timestamp)
-    elif params.interval == "1d":
-        time_group = func.date_trunc('day', TelemetryData.timestamp)
+    if by_auv:
+        rollup_part = rollup_part.where(rollup.c.auv_id == bindparam('auv_id'))
+        raw_part = raw_part.where(model.auv_id == bindparam('auv_id'))
+    raw_part = raw_part.group_by(raw_hour, model.auv_id)
+    
+    # Merge the hourly partials into the requested buckets
+    combined = union_all(rollup_part, raw_part).subquery()
+    time_group = func.date_bin(bucket_width, combined.c.bucket, BUCKET_ORIGIN)
+    select_fields = [time_group.label('interval_start'), combined.c.auv_id]
+    for metric in metrics:
+        count = func.sum(combined.c[f'{metric}_count'])
+        select_fields.extend([
+            func.min(combined.c[f'{metric}_min']).label(f'{metric}_min'),
+            func.max(combined.c[f'{metric}_max']).label(f'{metric}_max'),
+            (func.sum(combined.c[f'{metric}_sum']) / func.nullif(count, 0)).label(f'{metric}_avg'),
+            cast(count, BigInteger).label(f'{metric}_count')
+        ])
+    return select(*select_fields).group_by(time_group, combined.c.auv_id).order_by(time_group, combined.c.auv_id)
+
+
+def rollup_window(start_time: datetime, end_time: datetime) -> Tuple[datetime, datetime]:
+    """Whole hours of [start_time, end_time] served by the hourly rollup table, as (first_full_hour, rollup_end)"""
+    first_full_hour = floor_hour(start_time)
+    if first_full_hour < start_time:
+        first_full_hour += ROLLUP_BUCKET
+    # Inserts through the parent tables update the rollup in the same statement, so late uploads are
+    # current; DELETEs, UPDATEs and dropped partitions are not tracked, and rows moved between
+    # partitions (create_partition) are deliberately not re-counted
+    return first_full_hour, max(first_full_hour, floor_hour(end_time))
+
+
+def aggregation_row_shape(metrics: Tuple[str, ...], bucket_width: timedelta):
+    """Build the formatter turning an aggregation row into a TelemetryAggregationResponse-shaped dict"""
+    # Both aggregation queries select interval_start, auv_id, then (min, max, avg, count) per metric,
+    # so values are sliced by position
+    offsets = [(metric, 2 + 4 * i) for i, metric in enumerate(metrics)]
+    
+    def shape(result) -> Dict[str, Any]:
+        interval_start = result[0]
+        return {
+            'interval_start': interval_start,
+            'interval_end': interval_start + bucket_width,
+            'auv_id': result[1],
+            'metrics': {
+                metric: dict(zip(AGGREGATE_KEYS, result[offset:offset + 4]))
+                for metric, offset in offsets
+            }
+        }
+    
+    return shape
+
+
+def aggregate_telemetry(model, params: TelemetryAggregationParams) -> StreamingResponse:
+    """Stream min/max/avg/count of the requested metrics per AUV and time bucket"""
+    bucket_width = AGGREGATION_INTERVALS.get(params.interval, timedelta(hours=1))
+    metrics = tuple(metric for metric in params.metrics if metric in AGGREGATABLE_METRICS[model])
+    
+    # Statements are built once per (model, metrics, interval, AUV filter) and reused with fresh bind values
+    by_auv = bool(params.auv_id)
+    values = {'start_time': as_utc(params.start_time), 'end_time': as_utc(params.end_time)}
+    if by_auv:
+        values['auv_id'] = params.auv_id
+    
+    # Hour-multiple buckets over numeric metrics can be built from the hourly rollup table
+    rollup, rollup_metrics = HOURLY_ROLLUPS[model]
+    if bucket_width % ROLLUP_BUCKET == timedelta(0) and all(metric in rollup_metrics for metric in metrics):
+        values['first_full_hour'], values['rollup_end'] = rollup_window(values['start_time'], values['end_time'])
+        query = rollup_aggregation_query(model, rollup, metrics, bucket_width, by_auv)
     else:
-        time_group = func.date_trunc('hour', TelemetryData.timestamp)
-    
-    # Build aggregation query
-    select_fields = [time_group.label('interval_start')]
-    select_fields.append(TelemetryData.auv_id)
-    
-    for metric in params.metrics:
-        if hasattr(TelemetryData, metric):
-            select_fields.extend([
-                func.min(getattr(TelemetryData, metric)).label(f'{metric}_min'),
-                func.max(getattr(TelemetryData, metric)).label(f'{metric}_max'),
-                func.avg(getattr(TelemetryData, metric)).label(f'{metric}_avg'),
-                func.count(getattr(TelemetryData, metric)).label(f'{metric}_count')
-            ])
-    
-    query = query.with_entities(*select_fields).group_by(time_group, TelemetryData.auv_id)
-    
-    results = query.all()
-    
-    # Format results
-    formatted_results = []
-    for result in results:
-        metrics = {}
-        for metric in params.metrics:
-            if hasattr(TelemetryData, metric):
-                metrics[metric] = {
-                    'min': getattr(result, f'{metric}_min'),
-                    'max': getattr(result, f'{metric}_max'),
-                    'avg': getattr(result, f'{metric}_avg'),
-                    'count': getattr(result, f'{metric}_count')
-                }
-        
-        # Calculate interval_end based on interval type
-        interval_start = result.interval_start
-        if params.interval == "1m":
-            interval_end = interval_start + timedelta(minutes=1)
-        elif params.interval == "5m":
-            interval_end = interval_start + timedelta(minutes=5)
-        elif params.interval == "15m":
-            interval_end = interval_start + timedelta(minutes=15)
-        elif params.interval == "1h":
-            interval_end = interval_start + timedelta(hours=1)
-        elif params.interval == "1d":
-            interval_end = interval_start + timedelta(days=1)
-        else:
-            interval_end = interval_start + timedelta(hours=1)
-        
-        formatted_results.append(TelemetryAggregationResponse(
-            interval_start=interval_start,
-            interval_end=interval_end,
-            auv_id=result.auv_id,
-            metrics=metrics
-        ))
-    
-    return formatted_results
+        query = raw_aggregation_query(model, metrics, bucket_width, by_auv)
+    
+    return stream_json_array(query, aggregation_row_shape(metrics, bucket_width), values)
+
+
+@router.post("/aggregation/auv-data", response_model=List[TelemetryAggregationResponse])
+async def get_auv_data_aggregation(params: TelemetryAggregationParams):
+    """Get aggregated AUV telemetry data"""
+    return aggregate_telemetry(AUVData, params)
+
+
+@router.post("/aggregation/environmental", response_model=List[TelemetryAggregationResponse])
+async def get_environmental_aggregation(params: TelemetryAggregationParams):
+    """Get aggregated environmental telemetry data"""
+    return aggregate_telemetry(TelemetryData, params)
 
 
 # AUV-specific endpoints
-@router.get("/auv/{auv_id}/latest", response_model=Dict[str, Any])
-def get_auv_latest_data(auv_id: str, db: Session = Depends(get_db)):
-    """Get latest telemetry data for a specific AUV"""
-    # Get latest AUV data
-    latest_auv = db.query(AUVData).filter(
+async def load_latest_auv_data(db: AsyncSession, auv_id: str) -> Optional[Dict[str, Any]]:
+    """Newest AUV data row from the database, re-populating the latest cache"""
+    latest_auv = (await db.execute(select(*AUV_DATA_COLUMNS).where(
         AUVData.auv_id == auv_id
-    ).order_by(desc(AUVData.timestamp)).first()
-    
-    # Get latest environmental data
-    latest_env = db.query(TelemetryData).filter(
+    ).order_by(desc(AUVData.timestamp)).limit(1))).first()
+    if latest_auv is None:
+        return None
+    data = auv_data_dict(latest_auv)
+    cache_latest(latest_telemetry_key("auv", auv_id), latest_auv.timestamp, data, settings.TELEMETRY_LATEST_CACHE_SECONDS)
+    return data
+
+
+async def load_latest_env_data(db: AsyncSession, auv_id: str) -> Optional[Dict[str, Any]]:
+    """Newest environmental data row from the database, re-populating the latest cache"""
+    latest_env = (await db.execute(select(*TELEMETRY_DATA_COLUMNS).where(
         TelemetryData.auv_id == auv_id
-    ).order_by(desc(TelemetryData.timestamp)).first()
-    
-    # Convert database objects to dictionaries and handle datetime serialization
-    auv_data_dict = None
-    if latest_auv:
-        auv_data_dict = {
-            "id": latest_auv.id,
-            "auv_id": latest_auv.auv_id,
-            "timestamp": latest_auv.timestamp.isoformat(),
-            "latitude": latest_auv.latitude,
-            "longitude": latest_auv.longitude,
-            "depth": latest_auv.depth,
-            "altitude": latest_auv.altitude,
-            "heading": latest_auv.heading,
-            "speed": latest_auv.speed,
-            "battery_level": latest_auv.battery_level,
-            "temperature": latest_auv.temperature,
-            "pressure": latest_auv.pressure,
-            "system_status": latest_auv.system_status,
-            "mission_id": latest_auv.mission_id,
-            "mission_phase": latest_auv.mission_phase,
-            "telemetry_data": latest_auv.telemetry_data
-        }
-    
-    env_data_dict = None
-    if latest_env:
-        env_data_dict = {
-            "id": latest_env.id,
-            "auv_id": latest_env.auv_id,
-            "timestamp": latest_env.timestamp.isoformat(),
-            "water_temperature": latest_env.water_temperature,
-            "salinity": latest_env.salinity,
-            "ph_level": latest_env.ph_level,
-            "dissolved_oxygen": latest_env.dissolved_oxygen,
-            "turbidity": latest_env.turbidity,
-            "current_speed": latest_env.current_speed,
-            "current_direction": latest_env.current_direction,
-            "sensor_data": latest_env.sensor_data,
-            "data_quality_score": latest_env.data_quality_score,
-            "sensor_status": latest_env.sensor_status
-        }
+    ).order_by(desc(TelemetryData.timestamp)).limit(1))).first()
+    if latest_env is None:
+        return None
+    data = env_data_dict(latest_env)
+    cache_latest(latest_telemetry_key("environmental", auv_id), latest_env.timestamp, data, settings.TELEMETRY_LATEST_CACHE_SECONDS)
+    return data
+
+
+@router.get("/auv/{auv_id}/latest", response_model=Dict[str, Any])
+async def get_auv_latest_data(auv_id: str, db: AsyncSession = Depends(get_async_db)):
+    """Get latest telemetry data for a specific AUV"""
+    # Served from the latest-row cache written at ingest; the database is only hit on a miss
+    auv_data, env_data = await get_latest(
+        latest_telemetry_key("auv", auv_id),
+        latest_telemetry_key("environmental", auv_id)
+    )
+    if auv_data is None:
+        auv_data = await load_latest_auv_data(db, auv_id)
+    if env_data is None:
+        env_data = await load_latest_env_data(db, auv_id)
     
     return {
         "auv_id": auv_id,
-        "auv_data": auv_data_dict,
-        "environmental_data": env_data_dict,
+        "auv_data": auv_data,
+        "environmental_data": env_data,
         "timestamp": datetime.now(timezone.utc).isoformat()
     }
 
 
 @router.get("/auv/{auv_id}/status")
-def get_auv_status(auv_id: str, db: Session = Depends(get_db)):
+async def get_auv_status(auv_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get current status of a specific AUV"""
-    latest_data = db.query(AUVData).filter(
-        AUVData.auv_id == auv_id
-    ).order_by(desc(AUVData.timestamp)).first()
+    latest_data, = await get_latest(latest_telemetry_key("auv", auv_id))
+    if latest_data is None:
+        latest_data = await load_latest_auv_data(db, auv_id)
     
     if not latest_data:
         raise HTTPException(status_code=404, detail="AUV data not found")
     
     # Calculate time since last update (use timezone-aware datetime)
-    time_since_update = datetime.now(timezone.utc) - latest_data.timestamp
+    time_since_update = datetime.now(timezone.utc) - datetime.fromisoformat(latest_data["timestamp"])
     
     # Determine status based on last update time
     if time_since_update.total_seconds() < 300:  # 5 minutes
@@ -430,38 +549,39 @@ def get_auv_status(auv_id: str, db: Session = Depends(get_db)):
     return {
         "auv_id": auv_id,
         "status": status,
-        "last_update": latest_data.timestamp.isoformat(),
+        "last_update": latest_data["timestamp"],
         "time_since_update_seconds": time_since_update.total_seconds(),
-        "battery_level": latest_data.battery_level,
-        "system_status": latest_data.system_status,
+        "battery_level": latest_data["battery_level"],
+        "system_status": latest_data["system_status"],
         "position": {
-            "latitude": latest_data.latitude,
-            "longitude": latest_data.longitude,
-            "depth": latest_data.depth
+            "latitude": latest_data["latitude"],
+            "longitude": latest_data["longitude"],
+            "depth": latest_data["depth"]
         }
     }
 
 
 # Data Quality Endpoints
 @router.get("/quality/auv/{auv_id}")
-def get_auv_data_quality(auv_id: str, db: Session = Depends(get_db)):
+async def get_auv_data_quality(auv_id: str, db: AsyncSession = Depends(get_async_db)):
     """Get data quality metrics for a specific AUV"""
     # Get data from last 24 hours
     yesterday = datetime.now(timezone.utc) - timedelta(days=1)
     
-    auv_data_count = db.query(func.count(AUVData.id)).filter(
+    # Both counts in one round-trip; count(*) lets each be answered from the (auv_id, timestamp) index
+    auv_data_count_query = select(func.count()).select_from(AUVData).where(
         and_(
             AUVData.auv_id == auv_id,
             AUVData.timestamp >= yesterday
         )
-    ).scalar()
-    
-    env_data_count = db.query(func.count(TelemetryData.id)).filter(
+    ).scalar_subquery()
+    env_data_count_query = select(func.count()).select_from(TelemetryData).where(
         and_(
             TelemetryData.auv_id == auv_id,
             TelemetryData.timestamp >= yesterday
         )
-    ).scalar()
+    ).scalar_subquery()
+    auv_data_count, env_data_count = (await db.execute(select(auv_data_count_query, env_data_count_query))).one()
     
     # Calculate expected data points (assuming 1-minute intervals)
     expected_points = 24 * 60  # 24 hours * 60 minutes
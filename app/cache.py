@@ -0,0 +1,66 @@
+import logging
+from datetime import datetime
+from typing import Any, List, Optional
+import orjson
+import redis
+from app.redis_client import redis_client
+from app.redis_batcher import publisher
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+COMPLIANCE_SUMMARY_KEY = "isa:compliance:summary"
+STANDARDS_KEY = "isa:standards:all"
+ZONES_KEY = "isa:zones:all"
+
+
+async def get_cached(key: str) -> Optional[Any]:
+    """Return the cached JSON value for key, or None on a miss or Redis error"""
+    try:
+        value = await redis_client.get(key)
+    except redis.RedisError:
+        logger.warning("Cache read failed for %s", key, exc_info=True)
+        return None
+    return orjson.loads(value) if value is not None else None
+
+
+async def set_cached(key: str, value: Any, ttl_seconds: int):
+    """Store value as JSON under key with a TTL; failures only skip caching"""
+    try:
+        await redis_client.set(key, orjson.dumps(value), ex=ttl_seconds)
+    except redis.RedisError:
+        logger.warning("Cache write failed for %s", key, exc_info=True)
+
+
+async def invalidate(*keys: str):
+    """Drop cached values so the next read recomputes them"""
+    try:
+        await redis_client.delete(*keys)
+    except redis.RedisError:
+        logger.warning("Cache invalidation failed for %s", keys, exc_info=True)
+
+
+def latest_telemetry_key(stream: str, auv_id: str) -> str:
+    """Key holding the newest telemetry row of a stream ("auv" or "environmental") for an AUV"""
+    return f"telemetry:latest:{stream}:{auv_id}"
+
+
+def cache_latest(key: str, timestamp: datetime, value: Any, ttl_seconds: int):
+    """Queue value as the newest entry under key; a row with a later timestamp already cached is kept instead"""
+    # Sorted set scored by timestamp, trimmed to its highest member, so out-of-order writes cannot regress it
+    publisher.enqueue("ZADD", key, timestamp.timestamp(), orjson.dumps(value))
+    publisher.enqueue("ZREMRANGEBYRANK", key, 0, -2)
+    publisher.enqueue("EXPIRE", key, ttl_seconds)
+
+
+async def get_latest(*keys: str) -> List[Optional[Any]]:
+    """Return the newest cached value for each key in one round-trip, None for misses or on Redis error"""
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.zrange(key, -1, -1)
+            results = await pipe.execute()
+    except redis.RedisError:
+        logger.warning("Cache read failed for %s", keys, exc_info=True)
+        return [None] * len(keys)
+    return [orjson.loads(members[0]) if members else None for members in results]
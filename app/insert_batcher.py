@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import insert
+from app.database import AsyncSessionLocal
+from app.models.telemetry import AUVData, TelemetryData
+
+logger = logging.getLogger(__name__)
+
+# Maximum rows written by one multi-row INSERT
+INSERT_BATCH_SIZE = 100
+# Longest a row waits for others to join its batch
+INSERT_BATCH_DELAY_SECONDS = 0.01
+
+
+class InsertBatcher:
+    """Coalesce concurrent single-row inserts into multi-row INSERT ... RETURNING batches"""
+
+    def __init__(self, model, batch_size: int = INSERT_BATCH_SIZE, max_delay: float = INSERT_BATCH_DELAY_SECONDS):
+        self.model = model
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        # Only the server-generated and server-normalized columns come back; the rest are the submitted values
+        self._statement = insert(model).returning(
+            model.id, model.timestamp, model.created_at, sort_by_parameter_order=True
+        )
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the flush task on the running event loop"""
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush task, then write anything still queued"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            batch = [self._queue.get_nowait()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            await self._flush(batch)
+        self._task = None
+
+    async def submit(self, values: Dict[str, Any]):
+        """Queue one row and wait for it to be written; inserts directly if the batcher is not running.
+        Returns a detached model instance built from the values and the returned generated columns"""
+        if self._task is None:
+            return (await self.insert_many([values]))[0]
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((values, future))
+        return self._instance(values, await future)
+
+    async def insert_many(self, rows: List[Dict[str, Any]]) -> list:
+        """Write a client-supplied batch with one multi-row INSERT, bypassing the queue"""
+        generated = await self._insert(rows)
+        return [self._instance(values, row) for values, row in zip(rows, generated)]
+
+    def _instance(self, values: Dict[str, Any], generated):
+        return self.model(**{**values, **generated._mapping})
+
+    async def _insert(self, rows: List[Dict[str, Any]]) -> list:
+        async with AsyncSessionLocal() as session:
+            result = await session.execute(self._statement, rows)
+            generated = result.all()
+            await session.commit()
+            return generated
+
+    async def _flush(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        try:
+            generated = await self._insert([values for values, _ in batch])
+        except Exception as exc:
+            if len(batch) == 1:
+                logger.exception("Failed to insert %s row", self.model.__tablename__)
+                self._fail(batch, exc)
+                return
+            # Rows come from unrelated requests; retry them one by one so only the bad row's caller fails
+            logger.warning("Failed to insert %d %s rows, retrying individually", len(batch), self.model.__tablename__)
+            try:
+                for item in batch:
+                    await self._flush([item])
+            except BaseException:
+                self._fail(batch, RuntimeError("Insert cancelled"))
+                raise
+            return
+        except BaseException:
+            self._fail(batch, RuntimeError("Insert cancelled"))
+            raise
+        for (_, future), row in zip(batch, generated):
+            if not future.done():
+                future.set_result(row)
+
+    def _fail(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]], exc: Exception):
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(exc)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Block for the first row, then give others up to max_delay to join the batch
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._flush(batch)
+
+
+# Shared batchers for telemetry ingestion, started and stopped by the application lifespan
+auv_data_batcher = InsertBatcher(AUVData)
+telemetry_data_batcher = InsertBatcher(TelemetryData)
@@ -1,20 +1,51 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 from app.config import settings
-from app.database import engine, Base
+from app.database import async_engine, Base
 from app.api import isa_compliance, telemetry, alerts
+from app.tasks import (
+    refresh_alert_daily_rollup, ensure_telemetry_partitions,
+    run_periodically, PARTITION_MAINTENANCE_SECONDS
+)
+from app.redis_batcher import publisher
+from app.insert_batcher import auv_data_batcher, telemetry_data_batcher
+from app.pubsub_hub import telemetry_hub
+from app.redis_client import close_redis
 
 # Create database tables
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    Base.metadata.create_all(bind=engine)
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    # Partitions must exist before the first telemetry insert
+    await ensure_telemetry_partitions()
+    await publisher.start()
+    await auv_data_batcher.start()
+    await telemetry_data_batcher.start()
+    await telemetry_hub.start()
+    periodic_tasks = [
+        asyncio.create_task(
+            run_periodically(refresh_alert_daily_rollup, settings.ALERT_ROLLUP_REFRESH_SECONDS)
+        ),
+        asyncio.create_task(
+            run_periodically(ensure_telemetry_partitions, PARTITION_MAINTENANCE_SECONDS)
+        ),
+    ]
     yield
     # Shutdown
-    pass
+    for task in periodic_tasks:
+        task.cancel()
+    await telemetry_hub.stop()
+    await auv_data_batcher.stop()
+    await telemetry_data_batcher.stop()
+    await publisher.stop()
+    await close_redis()
+    await async_engine.dispose()
 
 # Create FastAPI app
 app = FastAPI(
@@ -23,6 +54,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -33,6 +65,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # Include API routers
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Enum
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, Enum, Index
+from sqlalchemy.sql import func, table, column
 from app.database import Base
 import enum
 
@@ -30,7 +30,7 @@ class Alert(Base):
     __tablename__ = "alerts"
     
     id = Column(Integer, primary_key=True, index=True)
-    auv_id = Column(String(50), nullable=False, index=True)
+    auv_id = Column(String(50), nullable=False)
     
     # Alert details
     alert_type = Column(Enum(AlertType), nullable=False)
@@ -45,7 +45,7 @@ class Alert(Base):
     # Metadata
     source = Column(String(100))  # sensor, system, manual, etc.
     location = Column(String(200))  # coordinates or zone
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    timestamp = Column(DateTime(timezone=True), nullable=False)
     
     # Resolution
     acknowledged_by = Column(String(100))
@@ -59,3 +59,28 @@ class Alert(Base):
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    __table_args__ = (
+        # AUV-scoped listings: filter on auv_id/status, newest first, without touching the heap
+        Index(
+            'ix_alerts_auv_status_ts',
+            auv_id, status, timestamp.desc(),
+            postgresql_include=['severity', 'alert_type', 'title']
+        ),
+        # AUV-scoped listings across all statuses, newest first
+        Index('ix_alerts_auv_ts', auv_id, timestamp.desc()),
+        # Keyset pagination on (timestamp, id)
+        Index('ix_alerts_timestamp_id', timestamp.desc(), id.desc()),
+    )
+
+
+# Daily alert counts, maintained as a materialized view (see alembic migrations).
+# Declared as a lightweight table so it stays out of Base.metadata.create_all.
+alert_daily_rollup = table(
+    "alert_daily_rollup",
+    column("day", DateTime(timezone=True)),
+    column("auv_id", String(50)),
+    column("severity", Enum(AlertSeverity)),
+    column("alert_type", Enum(AlertType)),
+    column("alert_count", Integer),
+)
@@ -1,15 +1,17 @@
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, JSON, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Float, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, table, column
 from app.database import Base
 
 
 class AUVData(Base):
     __tablename__ = "auv_data"
     
-    id = Column(Integer, primary_key=True, index=True)
-    auv_id = Column(String(50), nullable=False, index=True)
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    # Range-partitioned by month on timestamp, which therefore has to be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    auv_id = Column(String(50), nullable=False)
+    timestamp = Column(DateTime(timezone=True), primary_key=True, index=True)
     
     # Position and navigation
     latitude = Column(Float)
@@ -30,17 +32,26 @@ class AUVData(Base):
     mission_phase = Column(String(50))
     
     # Additional telemetry
-    telemetry_data = Column(JSON)  # Flexible JSON for additional metrics
+    telemetry_data = Column(JSONB)  # Flexible JSON for additional metrics
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    __table_args__ = (
+        # Per-AUV time ranges, aggregation buckets and latest-row lookups
+        Index('ix_auv_data_auv_ts', auv_id, timestamp.desc()),
+        # Compact block-range index for time-range scans over append-ordered rows
+        Index('ix_auv_data_timestamp_brin', timestamp, postgresql_using='brin', postgresql_with={'autosummarize': 'on'}),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
+    )
+
 
 class TelemetryData(Base):
     __tablename__ = "telemetry_data"
     
-    id = Column(Integer, primary_key=True, index=True)
-    auv_id = Column(String(50), nullable=False, index=True)
-    timestamp = Column(DateTime(timezone=True), nullable=False, index=True)
+    # Range-partitioned by month on timestamp, which therefore has to be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    auv_id = Column(String(50), nullable=False)
+    timestamp = Column(DateTime(timezone=True), primary_key=True, index=True)
     
     # Environmental readings
     water_temperature = Column(Float)
@@ -52,10 +63,46 @@ class TelemetryData(Base):
     current_direction = Column(Float)
     
     # Sensor readings
-    sensor_data = Column(JSON)  # Flexible JSON for sensor readings
+    sensor_data = Column(JSONB)  # Flexible JSON for sensor readings
     
     # Quality metrics
     data_quality_score = Column(Float)
     sensor_status = Column(String(50))
     
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # Per-AUV time ranges, aggregation buckets and latest-row lookups
+        Index('ix_telemetry_data_auv_ts', auv_id, timestamp.desc()),
+        # Compact block-range index for time-range scans over append-ordered rows
+        Index('ix_telemetry_data_timestamp_brin', timestamp, postgresql_using='brin', postgresql_with={'autosummarize': 'on'}),
+        {'postgresql_partition_by': 'RANGE (timestamp)'},
+    )
+
+
+# Metrics pre-aggregated per AUV and hour into the hourly rollup tables, kept current by insert triggers (see alembic migrations)
+AUV_DATA_ROLLUP_METRICS = (
+    "latitude", "longitude", "depth", "altitude", "heading", "speed",
+    "battery_level", "temperature", "pressure",
+)
+TELEMETRY_DATA_ROLLUP_METRICS = (
+    "water_temperature", "salinity", "ph_level", "dissolved_oxygen", "turbidity",
+    "current_speed", "current_direction", "data_quality_score",
+)
+
+
+def _hourly_rollup_table(name, metrics):
+    """Declare an hourly rollup table as a lightweight table so it stays out of Base.metadata.create_all"""
+    columns = [column("bucket", DateTime(timezone=True)), column("auv_id", String(50))]
+    for metric in metrics:
+        columns.extend([
+            column(f"{metric}_min", Float),
+            column(f"{metric}_max", Float),
+            column(f"{metric}_sum", Float),
+            column(f"{metric}_count", BigInteger),
+        ])
+    return table(name, *columns)
+
+
+auv_data_hourly_rollup = _hourly_rollup_table("auv_data_hourly_rollup", AUV_DATA_ROLLUP_METRICS)
+telemetry_data_hourly_rollup = _hourly_rollup_table("telemetry_data_hourly_rollup", TELEMETRY_DATA_ROLLUP_METRICS)
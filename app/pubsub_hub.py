@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Optional, Set
+import redis.asyncio as aioredis
+from app.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Messages buffered per WebSocket; past this the oldest are dropped for that slow client
+SUBSCRIBER_QUEUE_SIZE = 1000
+# Pause before resubscribing after the Redis connection fails
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+class PubSubHub:
+    """Hold one Redis pattern subscription per process and fan messages out to in-process queues by AUV ID"""
+
+    def __init__(self, client: aioredis.Redis, pattern: str = "telemetry:*"):
+        self._client = client
+        self.pattern = pattern
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._dropped: Dict[asyncio.Queue, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the reader task on the running event loop"""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the reader task and release its Redis connection"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def add(self, auv_id: str) -> asyncio.Queue:
+        """Register a new subscriber queue for an AUV's telemetry channels"""
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers[auv_id].add(queue)
+        return queue
+
+    def remove(self, auv_id: str, queue: asyncio.Queue):
+        """Unregister a subscriber queue"""
+        self._dropped.pop(queue, None)
+        queues = self._subscribers.get(auv_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[auv_id]
+
+    def take_dropped(self, queue: asyncio.Queue) -> int:
+        """Number of messages dropped for a subscriber since the last call"""
+        return self._dropped.pop(queue, 0)
+
+    def _dispatch(self, channel: bytes, data: bytes):
+        # Channels are telemetry:<stream>:<auv_id>
+        parts = channel.decode().split(":", 2)
+        if len(parts) != 3:
+            return
+        queues = self._subscribers.get(parts[2])
+        if not queues:
+            return
+        text = data.decode()
+        for queue in queues:
+            try:
+                queue.put_nowait(text)
+            except asyncio.QueueFull:
+                # Keep the newest telemetry; the subscriber is told how many messages it missed
+                queue.get_nowait()
+                queue.put_nowait(text)
+                self._dropped[queue] = self._dropped.get(queue, 0) + 1
+                logger.debug("Dropping oldest telemetry message for slow subscriber on %s", parts[2])
+
+    async def _run(self):
+        while True:
+            pubsub = self._client.pubsub()
+            try:
+                await pubsub.psubscribe(self.pattern)
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["channel"], message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Telemetry subscription failed, resubscribing")
+                await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            finally:
+                await pubsub.aclose()
+
+
+# Shared hub, started and stopped by the application lifespan
+telemetry_hub = PubSubHub(redis_client)
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+from typing import Any, List, Optional, Tuple
+import orjson
+import redis.asyncio as aioredis
+from app.redis_client import redis_client
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of messages flushed in one pipeline round-trip
+PUBLISH_BATCH_SIZE = 100
+# Commands held while Redis is slow or unreachable; further ones are dropped rather than growing memory without bound
+PUBLISH_QUEUE_SIZE = 10000
+
+
+class RedisPublisher:
+    """Queue Redis publishes and other fire-and-forget commands, flushing them in pipelined batches from a background task"""
+
+    def __init__(self, client: aioredis.Redis, batch_size: int = PUBLISH_BATCH_SIZE, queue_size: int = PUBLISH_QUEUE_SIZE):
+        self._client = client
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the flush task on the running event loop"""
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flush task, then flush anything still queued"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            await self._flush(self._drain([]))
+        self._task = None
+
+    def publish(self, channel: str, message: Any):
+        """Serialize message with orjson (native enums/datetimes, naive as UTC) and enqueue it from any thread"""
+        self.enqueue("PUBLISH", channel, orjson.dumps(message, option=orjson.OPT_NAIVE_UTC))
+
+    def enqueue(self, *command: Any):
+        """Enqueue a raw Redis command from any thread; its reply is discarded"""
+        if self._loop is None:
+            logger.warning("Redis publisher not started, dropping %s %s", command[0], command[1])
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._put(command)
+        else:
+            self._loop.call_soon_threadsafe(self._put, command)
+
+    def _put(self, command: Tuple[Any, ...]):
+        try:
+            self._queue.put_nowait(command)
+        except asyncio.QueueFull:
+            logger.warning("Redis publisher queue full, dropping %s %s", command[0], command[1])
+
+    def _drain(self, batch: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _flush(self, batch: List[Tuple[Any, ...]]):
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for command in batch:
+                    pipe.execute_command(*command)
+                await pipe.execute()
+        except Exception:
+            logger.exception("Failed to send %d commands to Redis", len(batch))
+
+    async def _run(self):
+        while True:
+            # Block for the first message, then take whatever else is already waiting
+            batch = self._drain([await self._queue.get()])
+            await self._flush(batch)
+
+
+# Shared publisher, started and stopped by the application lifespan
+publisher = RedisPublisher(redis_client)
@@ -0,0 +1,18 @@
+import redis.asyncio as aioredis
+from app.config import settings
+
+# One bounded connection pool shared by publishers, caches and subscribers in this process;
+# when every connection is busy, callers wait up to REDIS_POOL_TIMEOUT_SECONDS instead of failing
+redis_pool = aioredis.BlockingConnectionPool.from_url(
+    settings.REDIS_URL,
+    max_connections=settings.REDIS_MAX_CONNECTIONS,
+    timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+    socket_keepalive=True
+)
+redis_client = aioredis.Redis(connection_pool=redis_pool)
+
+
+async def close_redis():
+    """Close the shared client and every pooled connection"""
+    await redis_client.aclose()
+    await redis_pool.disconnect()
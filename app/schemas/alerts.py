@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 from datetime import datetime
 from enum import Enum
@@ -63,8 +63,7 @@ class AlertResponse(AlertBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Alert Query Schemas
@@ -97,26 +96,25 @@ class AlertFeedResponse(BaseModel):
     summary: AlertSummary
     total_count: int
     has_more: bool
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, if any")
 
 
 # Bulk Operation Schemas
 class BulkAcknowledgeRequest(BaseModel):
     alert_ids: List[int] = Field(..., description="List of alert IDs to acknowledge", example=[3, 5, 9])
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "alert_ids": [3, 5, 9]
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "alert_ids": [3, 5, 9]
         }
+    })
 
 
 class BulkResolveRequest(BaseModel):
     alert_ids: List[int] = Field(..., description="List of alert IDs to resolve", example=[3, 5, 9])
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "alert_ids": [3, 5, 9]
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "alert_ids": [3, 5, 9]
         }
+    })
@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 
 
@@ -18,6 +18,13 @@ class ZoneType(str, Enum):
     SAFETY = "SAFETY"
 
 
+def naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Normalize to naive UTC for the timezone-less isa_standards.effective_date column"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
 # ISA Standard Schemas
 class ISAStandardBase(BaseModel):
     standard_code: str = Field(..., description="Unique standard code")
@@ -28,6 +35,8 @@ class ISAStandardBase(BaseModel):
     category: str = Field(..., description="Category: safety, environmental, operational")
     requirements: Optional[str] = Field(None, description="Standard requirements")
 
+    _effective_date_naive = field_validator("effective_date")(naive_utc)
+
 
 class ISAStandardCreate(ISAStandardBase):
     pass
@@ -41,14 +50,15 @@ class ISAStandardUpdate(BaseModel):
     category: Optional[str] = None
     requirements: Optional[str] = None
 
+    _effective_date_naive = field_validator("effective_date")(naive_utc)
+
 
 class ISAStandardResponse(ISAStandardBase):
     id: int
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ISA Zone Schemas
@@ -83,8 +93,7 @@ class ISAZoneResponse(ISAZoneBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ISA Compliance Schemas
@@ -133,8 +142,7 @@ class ISAComplianceResponse(ISAComplianceBase):
     standard: Optional[ISAStandardResponse] = None
     zone: Optional[ISAZoneResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Summary and Dashboard Schemas
@@ -155,3 +163,8 @@ class ComplianceDashboard(BaseModel):
     upcoming_assessments: List[ISAComplianceResponse]
     standards: List[ISAStandardResponse]
     zones: List[ISAZoneResponse]
+
+
+# Whole-list validators for cached reference listings, built once at import
+ISAStandardResponseListAdapter = TypeAdapter(List[ISAStandardResponse])
+ISAZoneResponseListAdapter = TypeAdapter(List[ISAZoneResponse])
@@ -1,11 +1,11 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 
 # AUV Data Schemas
 class AUVDataBase(BaseModel):
-    auv_id: str = Field(..., description="AUV identifier")
+    auv_id: str = Field(..., max_length=50, description="AUV identifier")
     timestamp: datetime = Field(..., description="Data timestamp")
     latitude: Optional[float] = Field(None, description="Latitude")
     longitude: Optional[float] = Field(None, description="Longitude")
@@ -16,9 +16,9 @@ class AUVDataBase(BaseModel):
     battery_level: Optional[float] = Field(None, ge=0.0, le=100.0, description="Battery level percentage")
     temperature: Optional[float] = Field(None, description="System temperature in Celsius")
     pressure: Optional[float] = Field(None, description="Pressure in bar")
-    system_status: Optional[str] = Field(None, description="System status")
-    mission_id: Optional[str] = Field(None, description="Mission identifier")
-    mission_phase: Optional[str] = Field(None, description="Current mission phase")
+    system_status: Optional[str] = Field(None, max_length=50, description="System status")
+    mission_id: Optional[str] = Field(None, max_length=100, description="Mission identifier")
+    mission_phase: Optional[str] = Field(None, max_length=50, description="Current mission phase")
     telemetry_data: Optional[Dict[str, Any]] = Field(None, description="Additional telemetry data")
 
 
@@ -30,13 +30,12 @@ class AUVDataResponse(AUVDataBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Telemetry Data Schemas
 class TelemetryDataBase(BaseModel):
-    auv_id: str = Field(..., description="AUV identifier")
+    auv_id: str = Field(..., max_length=50, description="AUV identifier")
     timestamp: datetime = Field(..., description="Data timestamp")
     water_temperature: Optional[float] = Field(None, description="Water temperature in Celsius")
     salinity: Optional[float] = Field(None, description="Salinity in PSU")
@@ -47,7 +46,7 @@ class TelemetryDataBase(BaseModel):
     current_direction: Optional[float] = Field(None, description="Current direction in degrees")
     sensor_data: Optional[Dict[str, Any]] = Field(None, description="Additional sensor data")
     data_quality_score: Optional[float] = Field(None, ge=0.0, le=100.0, description="Data quality score")
-    sensor_status: Optional[str] = Field(None, description="Sensor status")
+    sensor_status: Optional[str] = Field(None, max_length=50, description="Sensor status")
 
 
 class TelemetryDataCreate(TelemetryDataBase):
@@ -58,8 +57,7 @@ class TelemetryDataResponse(TelemetryDataBase):
     id: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Real-time Telemetry Schemas
@@ -94,4 +92,4 @@ class TelemetryAggregationResponse(BaseModel):
     interval_start: datetime
     interval_end: datetime
     auv_id: str
-    metrics: Dict[str, Dict[str, float]]  # metric_name -> {min, max, avg, count}
+    metrics: Dict[str, Dict[str, Optional[float]]]  # metric_name -> {min, max, avg, count}; None when a bucket has no values
@@ -0,0 +1,39 @@
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+import orjson
+from fastapi.responses import StreamingResponse
+from app.database import AsyncSessionLocal
+
+# Rows fetched per server-side cursor round-trip when streaming
+STREAM_BATCH_SIZE = 500
+
+
+async def stream_encoded_batches(query, shape: Optional[Callable[[Any], Any]], params: Optional[Dict[str, Any]]) -> AsyncIterator[list]:
+    """Yield each server-side cursor batch as a list of orjson-encoded rows"""
+    # Own session so the cursor outlives the request's database dependency
+    async with AsyncSessionLocal() as session:
+        result = await session.stream(query.execution_options(yield_per=STREAM_BATCH_SIZE), params)
+        async for partition in result.partitions():
+            yield [orjson.dumps(shape(row) if shape else row._asdict()) for row in partition]
+
+
+def stream_json_array(query, shape: Optional[Callable[[Any], Any]] = None, params: Optional[Dict[str, Any]] = None) -> StreamingResponse:
+    """Stream query rows as a JSON array through a server-side cursor, encoding each batch with orjson"""
+
+    async def generate():
+        separator = b"["
+        async for batch in stream_encoded_batches(query, shape, params):
+            yield separator + b",".join(batch)
+            separator = b","
+        yield b"]" if separator == b"," else b"[]"
+
+    return StreamingResponse(generate(), media_type="application/json")
+
+
+def stream_ndjson(query, shape: Optional[Callable[[Any], Any]] = None, params: Optional[Dict[str, Any]] = None) -> StreamingResponse:
+    """Stream query rows as newline-delimited JSON, one object per line"""
+
+    async def generate():
+        async for batch in stream_encoded_batches(query, shape, params):
+            yield b"\n".join(batch) + b"\n"
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import text
+from app.database import async_engine
+
+logger = logging.getLogger(__name__)
+
+# Tables range-partitioned by month on timestamp, and how often their upcoming partitions are checked
+PARTITIONED_TABLES = ("auv_data", "telemetry_data")
+PARTITION_MAINTENANCE_SECONDS = 6 * 3600
+
+
+def month_start(value: datetime, months_ahead: int = 0) -> datetime:
+    """First instant (UTC) of the month months_ahead after value's month"""
+    month = value.month - 1 + months_ahead
+    return datetime(value.year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+async def refresh_alert_daily_rollup():
+    """Refresh the alert_daily_rollup materialized view without blocking readers"""
+    async with async_engine.begin() as conn:
+        await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY alert_daily_rollup"))
+
+
+async def ensure_telemetry_partitions(months_ahead: int = 1):
+    """Create the DEFAULT partition and this and the next months_ahead monthly partitions where missing"""
+    now = datetime.now(timezone.utc)
+    for name in PARTITIONED_TABLES:
+        async with async_engine.connect() as conn:
+            partitioned = await conn.scalar(
+                text("SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:name))"),
+                {"name": name}
+            )
+            # Only issue DDL for missing partitions, since creating one locks the parent table
+            missing = []
+            if partitioned:
+                if await conn.scalar(text("SELECT to_regclass(:name)"), {"name": f"{name}_default"}) is None:
+                    missing.append((f"{name}_default", None, None))
+                for offset in range(months_ahead + 1):
+                    start, end = month_start(now, offset), month_start(now, offset + 1)
+                    partition = f"{name}_{start:%Y%m}"
+                    if await conn.scalar(text("SELECT to_regclass(:name)"), {"name": partition}) is None:
+                        missing.append((partition, start, end))
+        # One transaction per partition, so a failure doesn't hold back the others
+        for partition, start, end in missing:
+            try:
+                await create_partition(name, partition, start, end)
+            except Exception:
+                logger.exception("Failed to create partition %s", partition)
+
+
+async def create_partition(table: str, partition: str, start: Optional[datetime], end: Optional[datetime]):
+    """Create one partition of table (DEFAULT when start is None), moving its rows out of the DEFAULT partition"""
+    async with async_engine.begin() as conn:
+        # Workers starting together serialize here; the loser finds the partition already there
+        await conn.execute(text("SELECT pg_advisory_xact_lock(hashtext(:table))"), {"table": table})
+        if start is None:
+            await conn.execute(text(f"CREATE TABLE IF NOT EXISTS {partition} PARTITION OF {table} DEFAULT"))
+            return
+        if await conn.scalar(text("SELECT to_regclass(:name)"), {"name": partition}) is not None:
+            return
+        # Rows for this month that arrived early (e.g. from a skewed AUV clock) sit in DEFAULT and would
+        # make the new bounds fail; set them aside and copy them into the partition once it exists
+        has_default = await conn.scalar(text("SELECT to_regclass(:name)"), {"name": f"{table}_default"}) is not None
+        if has_default:
+            await conn.execute(
+                text(
+                    f"CREATE TEMP TABLE {partition}_pending ON COMMIT DROP AS "
+                    f"WITH moved AS (DELETE FROM {table}_default WHERE timestamp >= :start AND timestamp < :end RETURNING *) "
+                    f"SELECT * FROM moved"
+                ),
+                {"start": start, "end": end}
+            )
+        await conn.execute(text(
+            f"CREATE TABLE {partition} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        ))
+        if has_default:
+            # Straight into the partition: the parent's rollup trigger already counted these rows when they
+            # first arrived, and statement triggers on the parent don't fire for inserts into a partition
+            moved = await conn.execute(text(f"INSERT INTO {partition} SELECT * FROM {partition}_pending"))
+            if moved.rowcount:
+                logger.info("Moved %d rows from %s_default into %s", moved.rowcount, table, partition)
+        logger.info("Created partition %s", partition)
+
+
+async def run_periodically(job, interval_seconds: float):
+    """Await job every interval_seconds until cancelled"""
+    while True:
+        try:
+            await job()
+        except Exception:
+            logger.exception("Periodic task %s failed", job.__name__)
+        await asyncio.sleep(interval_seconds)
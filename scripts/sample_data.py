@@ -9,12 +9,22 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from datetime import datetime, timedelta
 import random
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from app.database import SessionLocal, engine
 from app.models.isa_compliance import ISAStandard, ISAZone, ISACompliance, ComplianceStatus, ZoneType
 from app.models.telemetry import AUVData, TelemetryData
 from app.models.alerts import Alert, AlertSeverity, AlertType, AlertStatus
 
+# Choices drawn per generated row, built once
+COMPLIANCE_STATUSES = tuple(ComplianceStatus)
+ALERT_TYPES = tuple(AlertType)
+ALERT_SEVERITIES = tuple(AlertSeverity)
+ALERT_STATUSES = tuple(AlertStatus)
+SYSTEM_STATUSES = ("operational", "maintenance", "warning")
+MISSION_PHASES = ("survey", "data_collection", "transit", "docking")
+ALERT_SOURCES = ("sensor", "system", "manual")
+
 def create_sample_data():
     """Create sample data for the DeepSea API"""
     db = SessionLocal()
@@ -97,68 +107,75 @@ def create_sample_data():
         
         # Create sample AUVs and their data
         auv_ids = ["AUV-001", "AUV-002", "AUV-003", "AUV-004", "AUV-005"]
+        now = datetime.utcnow()
+        
+        # Rows are collected as plain dicts and written with one multi-row INSERT per table
+        compliance_rows = []
+        auv_rows = []
+        env_rows = []
+        alert_rows = []
         
         # Create ISA Compliance records
         print("Creating ISA Compliance records...")
         for auv_id in auv_ids:
             for standard in standards:
-                compliance = ISACompliance(
-                    auv_id=auv_id,
-                    standard_id=standard.id,
-                    zone_id=random.choice(zones).id if random.random() > 0.3 else None,
-                    status=random.choice(list(ComplianceStatus)),
-                    compliance_score=random.uniform(75.0, 100.0),
-                    last_assessment=datetime.utcnow() - timedelta(days=random.randint(1, 30)),
-                    next_assessment=datetime.utcnow() + timedelta(days=random.randint(30, 90)),
-                    zone_entry_time=datetime.utcnow() - timedelta(hours=random.randint(1, 24)) if random.random() > 0.5 else None,
-                    zone_exit_time=datetime.utcnow() - timedelta(hours=random.randint(1, 12)) if random.random() > 0.5 else None,
-                    zone_duration_minutes=random.randint(30, 480),
-                    violations_count=random.randint(0, 3),
-                    violations_description="Minor protocol deviation" if random.random() > 0.7 else None,
-                    corrective_actions="Updated operational procedures" if random.random() > 0.8 else None,
-                    notes="Regular compliance check completed"
-                )
-                db.add(compliance)
+                compliance_rows.append({
+                    "auv_id": auv_id,
+                    "standard_id": standard.id,
+                    "zone_id": random.choice(zones).id if random.random() > 0.3 else None,
+                    "status": random.choice(COMPLIANCE_STATUSES),
+                    "compliance_score": random.uniform(75.0, 100.0),
+                    "last_assessment": now - timedelta(days=random.randint(1, 30)),
+                    "next_assessment": now + timedelta(days=random.randint(30, 90)),
+                    "zone_entry_time": now - timedelta(hours=random.randint(1, 24)) if random.random() > 0.5 else None,
+                    "zone_exit_time": now - timedelta(hours=random.randint(1, 12)) if random.random() > 0.5 else None,
+                    "zone_duration_minutes": random.randint(30, 480),
+                    "violations_count": random.randint(0, 3),
+                    "violations_description": "Minor protocol deviation" if random.random() > 0.7 else None,
+                    "corrective_actions": "Updated operational procedures" if random.random() > 0.8 else None,
+                    "notes": "Regular compliance check completed"
+                })
+        db.execute(insert(ISACompliance), compliance_rows)
         
         # Create telemetry data
         print("Creating telemetry data...")
         for auv_id in auv_ids:
             # Create AUV data for the last 24 hours
             for i in range(24):
-                timestamp = datetime.utcnow() - timedelta(hours=i)
-                auv_data = AUVData(
-                    auv_id=auv_id,
-                    timestamp=timestamp,
-                    latitude=37.5 + random.uniform(-0.1, 0.1),
-                    longitude=-122.5 + random.uniform(-0.1, 0.1),
-                    depth=random.uniform(10, 200),
-                    altitude=random.uniform(5, 50),
-                    heading=random.uniform(0, 360),
-                    speed=random.uniform(1, 8),
-                    battery_level=random.uniform(20, 95),
-                    temperature=random.uniform(15, 25),
-                    pressure=random.uniform(1, 20),
-                    system_status=random.choice(["operational", "maintenance", "warning"]),
-                    mission_id=f"MISSION-{auv_id}-{timestamp.strftime('%Y%m%d')}",
-                    mission_phase=random.choice(["survey", "data_collection", "transit", "docking"])
-                )
-                db.add(auv_data)
+                timestamp = now - timedelta(hours=i)
+                auv_rows.append({
+                    "auv_id": auv_id,
+                    "timestamp": timestamp,
+                    "latitude": 37.5 + random.uniform(-0.1, 0.1),
+                    "longitude": -122.5 + random.uniform(-0.1, 0.1),
+                    "depth": random.uniform(10, 200),
+                    "altitude": random.uniform(5, 50),
+                    "heading": random.uniform(0, 360),
+                    "speed": random.uniform(1, 8),
+                    "battery_level": random.uniform(20, 95),
+                    "temperature": random.uniform(15, 25),
+                    "pressure": random.uniform(1, 20),
+                    "system_status": random.choice(SYSTEM_STATUSES),
+                    "mission_id": f"MISSION-{auv_id}-{timestamp.strftime('%Y%m%d')}",
+                    "mission_phase": random.choice(MISSION_PHASES)
+                })
                 
                 # Create environmental data
-                env_data = TelemetryData(
-                    auv_id=auv_id,
-                    timestamp=timestamp,
-                    water_temperature=random.uniform(12, 18),
-                    salinity=random.uniform(33, 35),
-                    ph_level=random.uniform(7.8, 8.2),
-                    dissolved_oxygen=random.uniform(6, 9),
-                    turbidity=random.uniform(0.1, 2.0),
-                    current_speed=random.uniform(0.1, 1.5),
-                    current_direction=random.uniform(0, 360),
-                    data_quality_score=random.uniform(85, 100),
-                    sensor_status="operational"
-                )
-                db.add(env_data)
+                env_rows.append({
+                    "auv_id": auv_id,
+                    "timestamp": timestamp,
+                    "water_temperature": random.uniform(12, 18),
+                    "salinity": random.uniform(33, 35),
+                    "ph_level": random.uniform(7.8, 8.2),
+                    "dissolved_oxygen": random.uniform(6, 9),
+                    "turbidity": random.uniform(0.1, 2.0),
+                    "current_speed": random.uniform(0.1, 1.5),
+                    "current_direction": random.uniform(0, 360),
+                    "data_quality_score": random.uniform(85, 100),
+                    "sensor_status": "operational"
+                })
+        db.execute(insert(AUVData), auv_rows)
+        db.execute(insert(TelemetryData), env_rows)
         
         # Create alerts
         print("Creating alerts...")
@@ -175,23 +192,23 @@ def create_sample_data():
         
         for auv_id in auv_ids:
             for i in range(random.randint(2, 5)):
-                alert = Alert(
-                    auv_id=auv_id,
-                    alert_type=random.choice(list(AlertType)),
-                    severity=random.choice(list(AlertSeverity)),
-                    status=random.choice(list(AlertStatus)),
-                    title=random.choice(alert_titles),
-                    description=f"Alert for {auv_id}: {random.choice(alert_titles)}",
-                    message=f"Detailed message for {auv_id} alert",
-                    source=random.choice(["sensor", "system", "manual"]),
-                    location=f"Lat: {37.5 + random.uniform(-0.1, 0.1)}, Lon: {-122.5 + random.uniform(-0.1, 0.1)}",
-                    timestamp=datetime.utcnow() - timedelta(hours=random.randint(1, 72)),
-                    acknowledged_by="operator" if random.random() > 0.5 else None,
-                    acknowledged_at=datetime.utcnow() - timedelta(hours=random.randint(1, 24)) if random.random() > 0.5 else None,
-                    resolved_by="technician" if random.random() > 0.7 else None,
-                    resolved_at=datetime.utcnow() - timedelta(hours=random.randint(1, 12)) if random.random() > 0.7 else None
-                )
-                db.add(alert)
+                alert_rows.append({
+                    "auv_id": auv_id,
+                    "alert_type": random.choice(ALERT_TYPES),
+                    "severity": random.choice(ALERT_SEVERITIES),
+                    "status": random.choice(ALERT_STATUSES),
+                    "title": random.choice(alert_titles),
+                    "description": f"Alert for {auv_id}: {random.choice(alert_titles)}",
+                    "message": f"Detailed message for {auv_id} alert",
+                    "source": random.choice(ALERT_SOURCES),
+                    "location": f"Lat: {37.5 + random.uniform(-0.1, 0.1)}, Lon: {-122.5 + random.uniform(-0.1, 0.1)}",
+                    "timestamp": now - timedelta(hours=random.randint(1, 72)),
+                    "acknowledged_by": "operator" if random.random() > 0.5 else None,
+                    "acknowledged_at": now - timedelta(hours=random.randint(1, 24)) if random.random() > 0.5 else None,
+                    "resolved_by": "technician" if random.random() > 0.7 else None,
+                    "resolved_at": now - timedelta(hours=random.randint(1, 12)) if random.random() > 0.7 else None
+                })
+        db.execute(insert(Alert), alert_rows)
         
         db.commit()
         print("Sample data created successfully!")
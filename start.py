@@ -3,73 +3,138 @@
 Startup script for DeepSea Data Ingestion API
 """
 
+import hashlib
+import importlib.util
+import logging
 import os
+import random
 import sys
 import subprocess
 import time
-import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def check_dependencies():
+# Readiness checks retry in concurrent threads; logging keeps their lines whole and formats them only when emitted
+logger = logging.getLogger("start")
+
+# Packages start.py needs before it can check services and launch the server
+REQUIRED_MODULES = ("fastapi", "uvicorn", "sqlalchemy", "redis")
+# Sentinels recording that the dependency check passed for a given requirements.txt
+DEPS_CACHE_DIR = Path(".cache")
+
+def dependencies_sentinel():
+    """Sentinel path keyed by the hash of requirements.txt, or None if there is no requirements file"""
+    requirements = Path("requirements.txt")
+    if not requirements.exists():
+        return None
+    digest = hashlib.sha256(requirements.read_bytes()).hexdigest()
+    return DEPS_CACHE_DIR / f"deps_ok_{digest}"
+
+def check_dependencies(force=False):
     """Check if required dependencies are installed"""
     print("Checking dependencies...")
     
-    try:
-        import fastapi
-        import uvicorn
-        import sqlalchemy
-        import redis
-        print("✓ All Python dependencies are installed")
-    except ImportError as e:
-        print(f"✗ Missing dependency: {e}")
+    # Skip the import probe when it already passed for these exact requirements
+    sentinel = dependencies_sentinel()
+    if sentinel is not None and sentinel.exists() and not force:
+        print("✓ Python dependencies unchanged since last check")
+        return True
+    
+    # find_spec locates each package without executing its code
+    missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"✗ Missing dependency: {', '.join(missing)}")
         print("Please run: pip install -r requirements.txt")
         return False
+    print("✓ All Python dependencies are installed")
     
+    if sentinel is not None:
+        sentinel.parent.mkdir(exist_ok=True)
+        sentinel.touch()
     return True
 
 def check_database():
     """Check if database is accessible"""
-    print("Checking database connection...")
+    logger.debug("Checking database connection...")
     
     try:
+        from sqlalchemy import text
         from app.database import engine
+        # The engine's pool keeps this connection open, so later checks skip the handshake
         with engine.connect() as conn:
-            conn.execute("SELECT 1")
-        print("✓ Database connection successful")
+            conn.execute(text("SELECT 1"))
+        logger.info("✓ Database connection successful")
         return True
     except Exception as e:
-        print(f"✗ Database connection failed: {e}")
-        print("Please ensure PostgreSQL is running and DATABASE_URL is correct")
+        logger.info("✗ Database connection failed: %s", e)
+        logger.info("Please ensure PostgreSQL is running and DATABASE_URL is correct")
         return False
 
+# Redis client reused across readiness checks; dropped after a failure so the next check reconnects
+_redis_client = None
+
+def get_redis():
+    """Return the shared Redis client, creating it on first use"""
+    global _redis_client
+    if _redis_client is None:
+        from app.config import settings
+        import redis
+        _redis_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=True,
+            socket_connect_timeout=2,
+            health_check_interval=30
+        )
+    return _redis_client
+
 def check_redis():
     """Check if Redis is accessible"""
-    print("Checking Redis connection...")
+    global _redis_client
+    logger.debug("Checking Redis connection...")
     
     try:
-        from app.config import settings
-        import redis
-        r = redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
-        r.ping()
-        print("✓ Redis connection successful")
+        get_redis().ping()
+        logger.info("✓ Redis connection successful")
         return True
     except Exception as e:
-        print(f"✗ Redis connection failed: {e}")
-        print("Please ensure Redis is running and REDIS_URL is correct")
+        _redis_client = None
+        logger.info("✗ Redis connection failed: %s", e)
+        logger.info("Please ensure Redis is running and REDIS_URL is correct")
+        return False
+
+def migrations_current():
+    """Check whether the database is already at the latest Alembic revision"""
+    try:
+        from alembic.config import Config
+        from alembic.migration import MigrationContext
+        from alembic.script import ScriptDirectory
+        from app.database import engine
+        head = ScriptDirectory.from_config(Config("alembic.ini")).get_current_head()
+        with engine.connect() as conn:
+            current = MigrationContext.configure(conn).get_current_revision()
+        return current == head
+    except Exception:
         return False
 
 def run_migrations():
     """Run database migrations"""
     print("Running database migrations...")
     
-    try:
-        result = subprocess.run(["alembic", "upgrade", "head"], 
-                              capture_output=True, text=True, check=True)
-        print("✓ Database migrations completed")
+    # Compare revisions in-process first so a warm start doesn't spawn Alembic just to find nothing to do
+    if migrations_current():
+        print("✓ Database schema is up to date")
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"✗ Migration failed: {e.stderr}")
+    
+    # Echo Alembic's output as it runs rather than buffering it until exit
+    process = subprocess.Popen(["alembic", "upgrade", "head"],
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1)
+    for line in process.stdout:
+        sys.stdout.write(line)
+    if process.wait() != 0:
+        print(f"✗ Migration failed with exit code {process.returncode}")
         return False
+    print("✓ Database migrations completed")
+    return True
 
 def create_sample_data():
     """Create sample data if database is empty"""
@@ -79,13 +144,15 @@ def create_sample_data():
         from app.database import SessionLocal
         from app.models.isa_compliance import ISAStandard
         
-        db = SessionLocal()
-        count = db.query(ISAStandard).count()
-        db.close()
+        # Fetching one id is enough to tell whether the table is empty
+        with SessionLocal() as db:
+            has_data = db.query(ISAStandard.id).first() is not None
         
-        if count == 0:
+        if not has_data:
             print("Creating sample data...")
-            subprocess.run([sys.executable, "scripts/sample_data.py"], check=True)
+            # Seed in-process, reusing the app modules already loaded here
+            from scripts.sample_data import create_sample_data as seed_sample_data
+            seed_sample_data()
             print("✓ Sample data created")
         else:
             print("✓ Sample data already exists")
@@ -102,44 +169,47 @@ def start_server():
     print("Press Ctrl+C to stop the server")
     
     try:
-        subprocess.run([
-            "uvicorn", "app.main:app", 
-            "--host", "0.0.0.0", 
-            "--port", "8000", 
-            "--reload"
-        ])
+        import uvicorn
+        uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
     except KeyboardInterrupt:
         print("\nServer stopped")
 
+# Backoff between readiness checks: starts short so a briefly unavailable service is picked up quickly,
+# doubles per attempt up to the cap, with jitter so co-starting workers don't probe in lockstep
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 5.0
+RETRY_JITTER = 0.2
+
+def retry_delay(attempt):
+    """Seconds to wait before the next readiness check"""
+    delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt))
+    return delay * random.uniform(1 - RETRY_JITTER, 1 + RETRY_JITTER)
+
+def wait_until(check, name, max_attempts=30):
+    """Retry a readiness check with backoff until it passes or attempts run out"""
+    for attempt in range(max_attempts):
+        if check():
+            return True
+        logger.info("Waiting for %s... (%d/%d)", name, attempt + 1, max_attempts)
+        time.sleep(retry_delay(attempt))
+    logger.info("%s not available after maximum attempts", name.capitalize())
+    return False
+
 def wait_for_services():
     """Wait for external services to be ready"""
     print("Waiting for services to be ready...")
     
-    # Wait for database
-    max_attempts = 30
-    for attempt in range(max_attempts):
-        if check_database():
-            break
-        print(f"Waiting for database... ({attempt + 1}/{max_attempts})")
-        time.sleep(2)
-    else:
-        print("Database not available after maximum attempts")
-        return False
-    
-    # Wait for Redis
-    for attempt in range(max_attempts):
-        if check_redis():
-            break
-        print(f"Waiting for Redis... ({attempt + 1}/{max_attempts})")
-        time.sleep(2)
-    else:
-        print("Redis not available after maximum attempts")
-        return False
-    
-    return True
+    # Probe the database and Redis concurrently so start-up waits for the slower one, not both in turn
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(wait_until, check_database, "database"),
+            executor.submit(wait_until, check_redis, "Redis")
+        ]
+        return all(future.result() for future in futures)
 
 def main():
     """Main startup function"""
+    logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), format="%(message)s", stream=sys.stdout)
     print("=" * 50)
     print("DeepSea Data Ingestion API Startup")
     print("=" * 50)
@@ -149,8 +219,8 @@ def main():
         print("✗ Please run this script from the Data-ingestion directory")
         sys.exit(1)
     
-    # Check dependencies
-    if not check_dependencies():
+    # Check dependencies (--force re-runs the check even if it passed for these requirements)
+    if not check_dependencies(force="--force" in sys.argv[1:]):
         sys.exit(1)
     
     # Wait for services
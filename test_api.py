@@ -4,50 +4,115 @@ Simple API test script for DeepSea Data Ingestion API
 """
 
 import requests
-import json
-from datetime import datetime
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
 
 BASE_URL = "http://localhost:8000/api/v1"
+# Independent requests within a test group run on this many threads
+MAX_PARALLEL_REQUESTS = 8
+# Samples sent per stream by the batch ingestion check
+INGEST_BATCH_SIZE = 10
+
+# One keep-alive session for every request, so the tests share a pooled connection
+session = requests.Session()
+session.headers.update({"Accept": "application/json"})
+
+# Request payloads; orjson encodes dataclasses directly, and __slots__ keeps each instance free of a per-object dict
+@dataclass
+class AUVPayload:
+    __slots__ = ("auv_id", "timestamp", "latitude", "longitude", "depth", "battery_level",
+                 "system_status", "mission_id", "mission_phase")
+    auv_id: str
+    timestamp: datetime
+    latitude: float
+    longitude: float
+    depth: float
+    battery_level: float
+    system_status: str
+    mission_id: str
+    mission_phase: str
+
+@dataclass
+class EnvironmentalPayload:
+    __slots__ = ("auv_id", "timestamp", "water_temperature", "salinity", "ph_level",
+                 "dissolved_oxygen", "data_quality_score")
+    auv_id: str
+    timestamp: datetime
+    water_temperature: float
+    salinity: float
+    ph_level: float
+    dissolved_oxygen: float
+    data_quality_score: float
+
+@dataclass
+class AlertPayload:
+    __slots__ = ("auv_id", "alert_type", "severity", "title", "description", "message",
+                 "source", "location", "timestamp")
+    auv_id: str
+    alert_type: str
+    severity: str
+    title: str
+    description: str
+    message: str
+    source: str
+    location: str
+    timestamp: datetime
 
 def test_health():
     """Test health endpoint"""
     print("Testing health endpoint...")
-    response = requests.get("http://localhost:8000/health")
+    response = session.get("http://localhost:8000/health")
     print(f"Status: {response.status_code}")
-    print(f"Response: {response.json()}")
+    print(f"Response: {orjson.loads(response.content)}")
     return response.status_code == 200
 
+def fetch_all(paths):
+    """GET independent endpoints concurrently; responses come back in request order"""
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        return list(executor.map(lambda path: session.get(f"{BASE_URL}{path}"), paths))
+
+def post(path, payload):
+    """POST a payload serialized with orjson (datetimes included, naive as UTC)"""
+    body = orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+    return session.post(f"{BASE_URL}{path}", data=body, headers={"Content-Type": "application/json"})
+
+def post_all(payloads):
+    """POST independent (path, body) pairs concurrently; responses come back in request order"""
+    with ThreadPoolExecutor(max_workers=MAX_PARALLEL_REQUESTS) as executor:
+        return list(executor.map(lambda item: post(*item), payloads))
+
 def test_isa_compliance():
     """Test ISA compliance endpoints"""
     print("\nTesting ISA compliance endpoints...")
     
+    standards, zones, compliance, dashboard = fetch_all([
+        "/isa-compliance/standards/",
+        "/isa-compliance/zones/",
+        "/isa-compliance/compliance/",
+        "/isa-compliance/dashboard/summary"
+    ])
+    
     # Test standards endpoint
-    response = requests.get(f"{BASE_URL}/isa-compliance/standards/")
-    print(f"Standards endpoint: {response.status_code}")
-    if response.status_code == 200:
-        standards = response.json()
-        print(f"Found {len(standards)} standards")
+    print(f"Standards endpoint: {standards.status_code}")
+    if standards.status_code == 200:
+        print(f"Found {len(orjson.loads(standards.content))} standards")
     
     # Test zones endpoint
-    response = requests.get(f"{BASE_URL}/isa-compliance/zones/")
-    print(f"Zones endpoint: {response.status_code}")
-    if response.status_code == 200:
-        zones = response.json()
-        print(f"Found {len(zones)} zones")
+    print(f"Zones endpoint: {zones.status_code}")
+    if zones.status_code == 200:
+        print(f"Found {len(orjson.loads(zones.content))} zones")
     
     # Test compliance endpoint
-    response = requests.get(f"{BASE_URL}/isa-compliance/compliance/")
-    print(f"Compliance endpoint: {response.status_code}")
-    if response.status_code == 200:
-        compliance = response.json()
-        print(f"Found {len(compliance)} compliance records")
+    print(f"Compliance endpoint: {compliance.status_code}")
+    if compliance.status_code == 200:
+        print(f"Found {len(orjson.loads(compliance.content))} compliance records")
     
     # Test dashboard
-    response = requests.get(f"{BASE_URL}/isa-compliance/dashboard/summary")
-    print(f"Dashboard summary: {response.status_code}")
-    if response.status_code == 200:
-        summary = response.json()
-        print(f"Dashboard: {summary}")
+    print(f"Dashboard summary: {dashboard.status_code}")
+    if dashboard.status_code == 200:
+        print(f"Dashboard: {orjson.loads(dashboard.content)}")
     
     return True
 
@@ -55,26 +120,26 @@ def test_telemetry():
     """Test telemetry endpoints"""
     print("\nTesting telemetry endpoints...")
     
+    auv_data, env_data, status = fetch_all([
+        "/telemetry/historical/auv-data?limit=5",
+        "/telemetry/historical/environmental?limit=5",
+        "/telemetry/auv/AUV-001/status"
+    ])
+    
     # Test historical AUV data
-    response = requests.get(f"{BASE_URL}/telemetry/historical/auv-data?limit=5")
-    print(f"Historical AUV data: {response.status_code}")
-    if response.status_code == 200:
-        data = response.json()
-        print(f"Found {len(data)} AUV data records")
+    print(f"Historical AUV data: {auv_data.status_code}")
+    if auv_data.status_code == 200:
+        print(f"Found {len(orjson.loads(auv_data.content))} AUV data records")
     
     # Test historical environmental data
-    response = requests.get(f"{BASE_URL}/telemetry/historical/environmental?limit=5")
-    print(f"Historical environmental data: {response.status_code}")
-    if response.status_code == 200:
-        data = response.json()
-        print(f"Found {len(data)} environmental data records")
+    print(f"Historical environmental data: {env_data.status_code}")
+    if env_data.status_code == 200:
+        print(f"Found {len(orjson.loads(env_data.content))} environmental data records")
     
     # Test AUV status
-    response = requests.get(f"{BASE_URL}/telemetry/auv/AUV-001/status")
-    print(f"AUV status: {response.status_code}")
-    if response.status_code == 200:
-        status = response.json()
-        print(f"AUV status: {status}")
+    print(f"AUV status: {status.status_code}")
+    if status.status_code == 200:
+        print(f"AUV status: {orjson.loads(status.content)}")
     
     return True
 
@@ -82,26 +147,26 @@ def test_alerts():
     """Test alerts endpoints"""
     print("\nTesting alerts endpoints...")
     
+    alerts, summary, feed = fetch_all([
+        "/alerts/?limit=5",
+        "/alerts/summary/",
+        "/alerts/feed/?limit=3"
+    ])
+    
     # Test alerts endpoint
-    response = requests.get(f"{BASE_URL}/alerts/?limit=5")
-    print(f"Alerts endpoint: {response.status_code}")
-    if response.status_code == 200:
-        alerts = response.json()
-        print(f"Found {len(alerts)} alerts")
+    print(f"Alerts endpoint: {alerts.status_code}")
+    if alerts.status_code == 200:
+        print(f"Found {len(orjson.loads(alerts.content))} alerts")
     
     # Test alert summary
-    response = requests.get(f"{BASE_URL}/alerts/summary/")
-    print(f"Alert summary: {response.status_code}")
-    if response.status_code == 200:
-        summary = response.json()
-        print(f"Alert summary: {summary}")
+    print(f"Alert summary: {summary.status_code}")
+    if summary.status_code == 200:
+        print(f"Alert summary: {orjson.loads(summary.content)}")
     
     # Test alert feed
-    response = requests.get(f"{BASE_URL}/alerts/feed/?limit=3")
-    print(f"Alert feed: {response.status_code}")
-    if response.status_code == 200:
-        feed = response.json()
-        print(f"Alert feed: {feed['total_count']} total alerts")
+    print(f"Alert feed: {feed.status_code}")
+    if feed.status_code == 200:
+        print(f"Alert feed: {orjson.loads(feed.content)['total_count']} total alerts")
     
     return True
 
@@ -109,41 +174,58 @@ def test_real_time_ingestion():
     """Test real-time data ingestion"""
     print("\nTesting real-time data ingestion...")
     
+    # One timestamp shared by the payloads of this batch
+    timestamp = datetime.now(timezone.utc)
+    
+    auv_data = AUVPayload(
+        auv_id="TEST-AUV-001",
+        timestamp=timestamp,
+        latitude=37.7749,
+        longitude=-122.4194,
+        depth=150.5,
+        battery_level=85.2,
+        system_status="operational",
+        mission_id="TEST-MISSION-001",
+        mission_phase="testing"
+    )
+    env_data = EnvironmentalPayload(
+        auv_id="TEST-AUV-001",
+        timestamp=timestamp,
+        water_temperature=15.2,
+        salinity=34.1,
+        ph_level=8.1,
+        dissolved_oxygen=7.8,
+        data_quality_score=92.5
+    )
+    auv_batch = [replace(auv_data, depth=auv_data.depth + i) for i in range(INGEST_BATCH_SIZE)]
+    env_batch = [replace(env_data, water_temperature=env_data.water_temperature + i * 0.1) for i in range(INGEST_BATCH_SIZE)]
+    
+    # The samples are independent, so all four requests are in flight together
+    auv_response, env_response, auv_batch_response, env_batch_response = post_all([
+        ("/telemetry/realtime/auv-data", auv_data),
+        ("/telemetry/realtime/environmental", env_data),
+        ("/telemetry/realtime/auv-data/batch", auv_batch),
+        ("/telemetry/realtime/environmental/batch", env_batch)
+    ])
+    
     # Test AUV data ingestion
-    auv_data = {
-        "auv_id": "TEST-AUV-001",
-        "timestamp": datetime.utcnow().isoformat(),
-        "latitude": 37.7749,
-        "longitude": -122.4194,
-        "depth": 150.5,
-        "battery_level": 85.2,
-        "system_status": "operational",
-        "mission_id": "TEST-MISSION-001",
-        "mission_phase": "testing"
-    }
-    
-    response = requests.post(f"{BASE_URL}/telemetry/realtime/auv-data", json=auv_data)
-    print(f"AUV data ingestion: {response.status_code}")
-    if response.status_code == 200:
-        result = response.json()
-        print(f"Ingested AUV data: {result['id']}")
+    print(f"AUV data ingestion: {auv_response.status_code}")
+    if auv_response.status_code == 200:
+        print(f"Ingested AUV data: {orjson.loads(auv_response.content)['id']}")
     
     # Test environmental data ingestion
-    env_data = {
-        "auv_id": "TEST-AUV-001",
-        "timestamp": datetime.utcnow().isoformat(),
-        "water_temperature": 15.2,
-        "salinity": 34.1,
-        "ph_level": 8.1,
-        "dissolved_oxygen": 7.8,
-        "data_quality_score": 92.5
-    }
-    
-    response = requests.post(f"{BASE_URL}/telemetry/realtime/environmental", json=env_data)
-    print(f"Environmental data ingestion: {response.status_code}")
-    if response.status_code == 200:
-        result = response.json()
-        print(f"Ingested environmental data: {result['id']}")
+    print(f"Environmental data ingestion: {env_response.status_code}")
+    if env_response.status_code == 200:
+        print(f"Ingested environmental data: {orjson.loads(env_response.content)['id']}")
+    
+    # Test batch ingestion: one request per stream carries the whole batch
+    print(f"AUV data batch ingestion: {auv_batch_response.status_code}")
+    if auv_batch_response.status_code == 200:
+        print(f"Ingested {len(orjson.loads(auv_batch_response.content))} AUV data records")
+    
+    print(f"Environmental data batch ingestion: {env_batch_response.status_code}")
+    if env_batch_response.status_code == 200:
+        print(f"Ingested {len(orjson.loads(env_batch_response.content))} environmental data records")
     
     return True
 
@@ -151,22 +233,22 @@ def test_alert_creation():
     """Test alert creation"""
     print("\nTesting alert creation...")
     
-    alert_data = {
-        "auv_id": "TEST-AUV-001",
-        "alert_type": "operational",
-        "severity": "medium",
-        "title": "Test Alert",
-        "description": "This is a test alert for API testing",
-        "message": "Test alert message with details",
-        "source": "test",
-        "location": "Test location",
-        "timestamp": datetime.utcnow().isoformat()
-    }
-    
-    response = requests.post(f"{BASE_URL}/alerts/", json=alert_data)
+    alert_data = AlertPayload(
+        auv_id="TEST-AUV-001",
+        alert_type="operational",
+        severity="medium",
+        title="Test Alert",
+        description="This is a test alert for API testing",
+        message="Test alert message with details",
+        source="test",
+        location="Test location",
+        timestamp=datetime.now(timezone.utc)
+    )
+    
+    response = post("/alerts/", alert_data)
     print(f"Alert creation: {response.status_code}")
     if response.status_code == 200:
-        result = response.json()
+        result = orjson.loads(response.content)
         print(f"Created alert: {result['id']}")
         return result['id']
     